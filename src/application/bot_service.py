@@ -1,13 +1,119 @@
 from typing import List, Optional, Dict, Tuple
 from ..domain.entities.bot import Bot
 from ..domain.entities.personality import Personality
-from ..domain.repositories.bot_repository import BotRepository
+from ..domain.repositories.bot_repository import BotRepository, WriteResult
 from ..infrastructure.config.settings import get_settings
-import logging
-from datetime import datetime
+from ..infrastructure.logging_setup import get_queued_file_logger
+import time
 from pathlib import Path
 import json
 import csv
+import re
+import numpy as np
+
+# Tamaño del buffer de escritura para exportaciones (1 MB)
+_EXPORT_BUFFER_SIZE = 1 << 20
+
+# Mensajes de resultado de las operaciones sobre bots
+_MSG_INVALID_NAME = "Nombre de bot inválido"
+_CREATE_MESSAGES = {
+    WriteResult.SUCCESS: "Bot creado exitosamente",
+    WriteResult.ALREADY_EXISTS: "Ya existe un bot con ese nombre",
+    WriteResult.ERROR: "Error al guardar el bot",
+}
+_UPDATE_MESSAGES = {
+    WriteResult.SUCCESS: "Bot actualizado exitosamente",
+    WriteResult.NOT_FOUND: "Bot no encontrado",
+    WriteResult.ERROR: "Error al actualizar el bot",
+}
+_DELETE_MESSAGES = {
+    WriteResult.SUCCESS: "Bot eliminado exitosamente",
+    WriteResult.NOT_FOUND: "Bot no encontrado",
+    WriteResult.ERROR: "Error al eliminar el bot",
+}
+
+# Nombres de bot válidos: de 3 a 64 caracteres alfanuméricos (incluye acentos),
+# guiones, guiones bajos o espacios internos; sin espacios al principio ni al final
+_BOT_NAME_RE = re.compile(r'^\w[\w\- ]{1,62}\w$')
+
+# Última marca de tiempo formateada: (segundo epoch, texto)
+_last_timestamp: Tuple[int, str] = (-1, "")
+
+def _current_timestamp() -> str:
+    """Retorna la fecha y hora actuales formateadas, reutilizando el texto dentro del mismo segundo"""
+    global _last_timestamp
+    now = int(time.time())
+    if _last_timestamp[0] != now:
+        _last_timestamp = (now, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)))
+    return _last_timestamp[1]
+
+def _bots_to_matrix(bots: List[Bot], codes: Tuple[str, ...]) -> np.ndarray:
+    """
+    Construye una matriz (n_bots, n_rasgos) con los valores de personalidad.
+    Se usa float32: los valores están acotados en [-1, 1] y basta esa precisión
+    para estadísticas agregadas, con la mitad de memoria que float64.
+    """
+    if codes == Personality.CODES:
+        # Orden nativo: se apilan directamente los arrays de valores
+        if not bots:
+            return np.empty((0, len(codes)), dtype=np.float32)
+        return np.stack([bot.personality._values for bot in bots]).astype(np.float32)
+    return np.fromiter(
+        (bot.personality.factors[code].value for bot in bots for code in codes),
+        dtype=np.float32,
+        count=len(bots) * len(codes)
+    ).reshape(len(bots), len(codes))
+
+class _TraitAccumulator:
+    """
+    Sumas acumuladas de los vectores de personalidad de todos los bots.
+    Permite obtener medias y correlaciones en O(K²) sin recorrer los bots,
+    actualizándose en O(K²) con cada alta, modificación o baja.
+    """
+    
+    # Varianzas por debajo de este valor se consideran nulas (rasgo constante)
+    _VARIANCE_EPSILON = 1e-12
+    
+    def __init__(self, n_traits: int):
+        self.count = 0
+        self.sum = np.zeros(n_traits)
+        self.sum_products = np.zeros((n_traits, n_traits))
+        # Vector aportado por cada bot, para poder descontarlo al modificarlo o eliminarlo
+        self._vectors: Dict[str, np.ndarray] = {}
+        
+    def add(self, name: str, vector: np.ndarray):
+        """Añade (o reemplaza) la contribución de un bot"""
+        self.remove(name)
+        self._vectors[name] = vector
+        self.count += 1
+        self.sum += vector
+        self.sum_products += np.outer(vector, vector)
+        
+    def remove(self, name: str):
+        """Descuenta la contribución de un bot, si existe"""
+        vector = self._vectors.pop(name, None)
+        if vector is not None:
+            self.count -= 1
+            self.sum -= vector
+            self.sum_products -= np.outer(vector, vector)
+            
+    def means(self) -> np.ndarray:
+        """Media de cada rasgo"""
+        return self.sum / self.count
+        
+    def correlations(self) -> np.ndarray:
+        """Matriz de correlaciones de Pearson entre rasgos"""
+        mean = self.means()
+        covariance = self.sum_products / self.count - np.outer(mean, mean)
+        std = np.sqrt(np.clip(np.diag(covariance), 0.0, None))
+        denominator = np.outer(std, std)
+        # Los rasgos constantes tienen varianza cero; su correlación se toma como 0
+        correlations = np.divide(
+            covariance, denominator,
+            out=np.zeros_like(covariance),
+            where=denominator > self._VARIANCE_EPSILON
+        )
+        return np.clip(correlations, -1.0, 1.0)
 
 class BotService:
     """
@@ -15,91 +121,89 @@ class BotService:
     Implementa la lógica de negocio y coordina las operaciones entre la UI y el repositorio.
     """
     
+    # Parámetros del clustering k-means de personalidades
+    _MAX_CLUSTERS = 8
+    _CLUSTERING_ITERATIONS = 20
+    
     def __init__(self, repository: BotRepository):
         self.repository = repository
         self.settings = get_settings()
         self._setup_logging()
         
+        # Cachés de estadísticas: por bot (nombre -> (huella, estadísticas)) y
+        # global, ligada a la versión del repositorio con la que se calculó
+        self._stats_cache: Dict[str, Tuple[bytes, Tuple[Dict, List, Dict]]] = {}
+        self._global_stats_cache: Optional[Tuple[int, Dict]] = None
+        
+        # Sumas incrementales para medias y correlaciones, junto con la versión del
+        # repositorio que reflejan; se construyen en el primer uso
+        self._accumulator: Optional[Tuple[int, _TraitAccumulator]] = None
+        
     def _setup_logging(self):
-        """Configura el logging para el servicio"""
-        self.logger = logging.getLogger(__name__)
-        if not self.logger.handlers:
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler = logging.FileHandler('bot_service.log')
-            handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
-            self.logger.setLevel(logging.INFO)
+        """Configura el logging para el servicio, escrito en segundo plano"""
+        self.logger = get_queued_file_logger(__name__, 'bot_service.log')
 
     def create_bot(self, name: str, personality: Optional[Personality] = None) -> Tuple[bool, str]:
         """
         Crea un nuevo bot.
         Retorna una tupla (éxito, mensaje).
         """
-        try:
-            # Validar nombre
-            if not self._validate_bot_name(name):
-                return False, "Nombre de bot inválido"
-            
-            # Verificar si ya existe
-            if self.repository.exists(name):
-                return False, "Ya existe un bot con ese nombre"
-            
-            # Crear bot
-            bot = Bot(
-                name=name,
-                personality=personality if personality else Personality()
-            )
+        # Validar nombre
+        if not self._validate_bot_name(name):
+            return False, _MSG_INVALID_NAME
             
-            # Guardar
-            if self.repository.save(bot):
-                self.logger.info(f"Bot creado exitosamente: {name}")
-                return True, "Bot creado exitosamente"
-            else:
-                return False, "Error al guardar el bot"
-                
+        # Crear bot
+        bot = Bot(
+            name=name,
+            personality=personality if personality else Personality()
+        )
+        
+        # Guardar (la comprobación de existencia la hace el repositorio)
+        version = self.repository.version
+        try:
+            result = self.repository.try_create(bot)
         except Exception as e:
-            self.logger.error(f"Error al crear bot: {str(e)}")
-            return False, f"Error al crear bot: {str(e)}"
+            self.logger.error("Error al crear bot: %s", e)
+            return False, f"Error al crear bot: {e}"
+            
+        if result is WriteResult.SUCCESS:
+            self._invalidate_statistics(version, name)
+            self.logger.info("Bot creado exitosamente: %s", name)
+        return result is WriteResult.SUCCESS, _CREATE_MESSAGES[result]
             
     def update_bot(self, bot: Bot) -> Tuple[bool, str]:
         """
         Actualiza un bot existente.
         Retorna una tupla (éxito, mensaje).
         """
+        version = self.repository.version
         try:
-            if not self.repository.exists(bot.name):
-                return False, "Bot no encontrado"
-                
-            if self.repository.update(bot):
-                self.logger.info(f"Bot actualizado: {bot.name}")
-                return True, "Bot actualizado exitosamente"
-            else:
-                return False, "Error al actualizar el bot"
-                
+            result = self.repository.try_update(bot)
         except Exception as e:
-            self.logger.error(f"Error al actualizar bot: {str(e)}")
-            return False, f"Error al actualizar bot: {str(e)}"
+            self.logger.error("Error al actualizar bot: %s", e)
+            return False, f"Error al actualizar bot: {e}"
+            
+        if result is WriteResult.SUCCESS:
+            self._invalidate_statistics(version, bot.name)
+            self.logger.info("Bot actualizado: %s", bot.name)
+        return result is WriteResult.SUCCESS, _UPDATE_MESSAGES[result]
             
     def delete_bot(self, name: str) -> Tuple[bool, str]:
         """
         Elimina un bot.
         Retorna una tupla (éxito, mensaje).
         """
+        version = self.repository.version
         try:
-            if not self.repository.exists(name):
-                return False, "Bot no encontrado"
-                
-            if self.repository.delete(name):
-                self.logger.info(f"Bot eliminado: {name}")
-                return True, "Bot eliminado exitosamente"
-            else:
-                return False, "Error al eliminar el bot"
-                
+            result = self.repository.try_delete(name)
         except Exception as e:
-            self.logger.error(f"Error al eliminar bot: {str(e)}")
-            return False, f"Error al eliminar bot: {str(e)}"
+            self.logger.error("Error al eliminar bot: %s", e)
+            return False, f"Error al eliminar bot: {e}"
+            
+        if result is WriteResult.SUCCESS:
+            self._invalidate_statistics(version, name)
+            self.logger.info("Bot eliminado: %s", name)
+        return result is WriteResult.SUCCESS, _DELETE_MESSAGES[result]
             
     def get_bot(self, name: str) -> Optional[Bot]:
         """Obtiene un bot por su nombre"""
@@ -110,24 +214,71 @@ class BotService:
         return self.repository.get_all()
         
     def get_bot_statistics(self, bot: Bot) -> Dict:
-        """Calcula estadísticas para un bot específico"""
-        stats = {
+        """
+        Calcula estadísticas para un bot específico.
+        Las estadísticas de personalidad se reutilizan mientras sus valores no
+        cambien; cada llamada recibe su propia copia y la fecha actual.
+        """
+        fingerprint = bot.personality._values.tobytes()
+        cached = self._stats_cache.get(bot.name)
+        if cached is not None and cached[0] == fingerprint:
+            personality_stats, dominant_traits, trait_distribution = cached[1]
+        else:
+            personality_stats = self._calculate_personality_stats(bot.personality)
+            dominant_traits = bot.personality.dominant_traits()
+            trait_distribution = bot.personality.trait_distribution()
+            self._stats_cache[bot.name] = (
+                fingerprint, (personality_stats, dominant_traits, trait_distribution)
+            )
+            
+        # Copias superficiales: los valores internos son inmutables
+        return {
             'name': bot.name,
             'creation_date': self._get_bot_creation_date(bot),
-            'personality_stats': self._calculate_personality_stats(bot.personality),
-            'dominant_traits': self._get_dominant_traits(bot.personality),
-            'trait_distribution': self._calculate_trait_distribution(bot.personality)
+            'personality_stats': dict(personality_stats),
+            'dominant_traits': list(dominant_traits),
+            'trait_distribution': dict(trait_distribution)
         }
-        return stats
         
     def get_global_statistics(self) -> Dict:
-        """Calcula estadísticas globales para todos los bots"""
-        bots = self.get_all_bots()
+        """
+        Calcula estadísticas globales para todos los bots.
+        El resultado se reutiliza mientras no cambie la versión del repositorio,
+        incluidas las modificaciones hechas sin pasar por el servicio; cada
+        llamada recibe su propia copia.
+        """
+        # La versión se lee antes de los datos: si cambian durante el cálculo,
+        # la siguiente llamada recalcula
+        version = self.repository.version
+        cached = self._global_stats_cache
+        if cached is not None and cached[0] == version:
+            return self._copy_global_statistics(cached[1])
+            
+        # Medias y correlaciones salen de las sumas incrementales; el clustering
+        # necesita la matriz completa, que se construye en una única pasada
+        codes = Personality.CODES
+        accumulator = self._get_accumulator()
+        matrix = _bots_to_matrix(self.get_all_bots(), codes)
+        stats = {
+            'total_bots': len(matrix),
+            'average_traits': self._calculate_average_traits(codes, accumulator),
+            'trait_correlations': self._calculate_trait_correlations(codes, accumulator),
+            'personality_clusters': self._identify_personality_clusters(codes, matrix)
+        }
+        self._global_stats_cache = (version, stats)
+        return self._copy_global_statistics(stats)
+        
+    @staticmethod
+    def _copy_global_statistics(stats: Dict) -> Dict:
+        """Copia las estadísticas globales cacheadas; los valores internos son inmutables"""
         return {
-            'total_bots': len(bots),
-            'average_traits': self._calculate_average_traits(bots),
-            'trait_correlations': self._calculate_trait_correlations(bots),
-            'personality_clusters': self._identify_personality_clusters(bots)
+            'total_bots': stats['total_bots'],
+            'average_traits': dict(stats['average_traits']),
+            'trait_correlations': list(stats['trait_correlations']),
+            'personality_clusters': [
+                {'centroid': dict(cluster['centroid']), 'size': cluster['size']}
+                for cluster in stats['personality_clusters']
+            ]
         }
         
     def export_bots(self, format: str, file_path: str) -> Tuple[bool, str]:
@@ -166,86 +317,148 @@ class BotService:
             self.logger.error(f"Error al importar bots: {str(e)}")
             return False, f"Error al importar: {str(e)}"
             
+    def _invalidate_statistics(self, version: int, *names: str):
+        """
+        Descarta las estadísticas cacheadas afectadas por una modificación
+        y actualiza las sumas incrementales con el estado actual de esos bots.
+        `version` es la versión del repositorio leída antes de la modificación:
+        si las sumas no la reflejan, hubo otros cambios fuera del servicio y
+        se descartan para reconstruirlas en el siguiente uso.
+        """
+        for name in names:
+            self._stats_cache.pop(name, None)
+            
+        if self._accumulator is None:
+            return
+        accumulator_version, accumulator = self._accumulator
+        if accumulator_version != version:
+            self._accumulator = None
+            return
+            
+        current_version = self.repository.version
+        for name in names:
+            bot = self.repository.get(name)
+            if bot is None:
+                accumulator.remove(name)
+            else:
+                accumulator.add(name, self._personality_vector(bot.personality))
+        self._accumulator = (current_version, accumulator)
+                    
+    def _get_accumulator(self) -> _TraitAccumulator:
+        """
+        Retorna las sumas incrementales, reconstruyéndolas en el primer uso o
+        si el repositorio cambió sin pasar por el servicio
+        """
+        version = self.repository.version
+        if self._accumulator is None or self._accumulator[0] != version:
+            accumulator = _TraitAccumulator(len(Personality.CODES))
+            for bot in self.get_all_bots():
+                accumulator.add(bot.name, self._personality_vector(bot.personality))
+            self._accumulator = (version, accumulator)
+        return self._accumulator[1]
+            
     def _validate_bot_name(self, name: str) -> bool:
         """Valida el nombre del bot"""
-        if not name or len(name) < 3:
-            return False
-        # Añadir más validaciones según necesidades
-        return True
+        return bool(name and _BOT_NAME_RE.fullmatch(name))
         
     def _get_bot_creation_date(self, bot: Bot) -> str:
         """Obtiene la fecha de creación del bot"""
         # Implementar según el sistema de metadatos
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return _current_timestamp()
         
     def _calculate_personality_stats(self, personality: Personality) -> Dict:
         """Calcula estadísticas de personalidad"""
-        values = [f.value for f in personality.factors.values()]
+        values = self._personality_vector(personality)
         return {
-            'mean': sum(values) / len(values),
-            'max': max(values),
-            'min': min(values),
-            'extreme_traits_count': len([v for v in values if abs(v) > 0.7])
+            'mean': float(values.mean()),
+            'max': float(values.max()),
+            'min': float(values.min()),
+            'extreme_traits_count': int(np.count_nonzero(np.abs(values) > 0.7))
         }
         
-    def _get_dominant_traits(self, personality: Personality, threshold: float = 0.7) -> List[Tuple[str, float]]:
-        """Identifica los rasgos dominantes de la personalidad"""
-        dominant = []
-        for code, factor in personality.factors.items():
-            if abs(factor.value) > threshold:
-                dominant.append((code, factor.value))
-        return sorted(dominant, key=lambda x: abs(x[1]), reverse=True)
+    def _personality_vector(self, personality: Personality) -> np.ndarray:
+        """Extrae una copia de los valores de personalidad como un vector"""
+        return personality._values.copy()
         
-    def _calculate_trait_distribution(self, personality: Personality) -> Dict:
-        """Calcula la distribución de rasgos"""
-        distribution = {
-            'very_low': 0,  # < -0.7
-            'low': 0,      # -0.7 to -0.3
-            'neutral': 0,  # -0.3 to 0.3
-            'high': 0,     # 0.3 to 0.7
-            'very_high': 0 # > 0.7
-        }
+    def _calculate_average_traits(self, codes: Tuple[str, ...], accumulator: _TraitAccumulator) -> Dict:
+        """Calcula el promedio de cada rasgo entre todos los bots"""
+        if not accumulator.count:
+            return {}
+        return dict(zip(codes, accumulator.means().tolist()))
         
-        for factor in personality.factors.values():
-            value = factor.value
-            if value < -0.7:
-                distribution['very_low'] += 1
-            elif value < -0.3:
-                distribution['low'] += 1
-            elif value < 0.3:
-                distribution['neutral'] += 1
-            elif value < 0.7:
-                distribution['high'] += 1
-            else:
-                distribution['very_high'] += 1
-                
-        return distribution
+    def _calculate_trait_correlations(self, codes: Tuple[str, ...],
+                                      accumulator: _TraitAccumulator) -> List[Tuple[str, str, float]]:
+        """Calcula la correlación de Pearson entre cada par de rasgos"""
+        if accumulator.count < 2:
+            return []
+            
+        correlations = accumulator.correlations()
+        rows, cols = np.triu_indices(len(codes), k=1)
+        return [
+            (codes[i], codes[j], value)
+            for i, j, value in zip(rows.tolist(), cols.tolist(), correlations[rows, cols].tolist())
+        ]
         
-    def _calculate_average_traits(self, bots: List[Bot]) -> Dict:
-        """Calcula el promedio de cada rasgo entre todos los bots"""
-        trait_sums = {code: 0.0 for code in Personality.FACTORS.keys()}
-        for bot in bots:
-            for code, factor in bot.personality.factors.items():
-                trait_sums[code] += factor.value
-                
-        return {code: value/len(bots) for code, value in trait_sums.items()}
+    def _identify_personality_clusters(self, codes: Tuple[str, ...], matrix: np.ndarray) -> List[Dict]:
+        """
+        Identifica grupos de personalidades similares mediante k-means.
+        Cada grupo incluye su centroide (valor medio por rasgo) y su tamaño.
+        """
+        if not len(matrix):
+            return []
+            
+        centroids, labels = self._kmeans(matrix, min(self._MAX_CLUSTERS, len(matrix)))
+        sizes = np.bincount(labels, minlength=len(centroids))
+        return [
+            {'centroid': dict(zip(codes, centroid)), 'size': size}
+            for centroid, size in zip(centroids.tolist(), sizes.tolist())
+            if size > 0
+        ]
         
-    def _calculate_trait_correlations(self, bots: List[Bot]) -> List[Tuple[str, str, float]]:
-        """Calcula correlaciones entre rasgos"""
-        # Implementar cálculo de correlaciones según necesidades
-        return []
+    def _kmeans(self, matrix: np.ndarray, n_clusters: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Algoritmo de Lloyd vectorizado.
+        Retorna los centroides y la etiqueta de grupo de cada fila de la matriz.
+        """
+        # Semilla fija para que las estadísticas sean reproducibles
+        rng = np.random.default_rng(0)
+        centroids = matrix[rng.choice(len(matrix), size=n_clusters, replace=False)]
+        squared_norms = (matrix * matrix).sum(axis=1)[:, None]
         
-    def _identify_personality_clusters(self, bots: List[Bot]) -> List[Dict]:
-        """Identifica grupos de personalidades similares"""
-        # Implementar clustering según necesidades
-        return []
+        for _ in range(self._CLUSTERING_ITERATIONS):
+            # ||x - c||² = ||x||² - 2·x·c + ||c||², resuelto con un producto de matrices
+            distances = squared_norms - 2 * matrix @ centroids.T + (centroids * centroids).sum(axis=1)
+            labels = distances.argmin(axis=1)
+            
+            membership = np.eye(n_clusters, dtype=matrix.dtype)[labels]
+            counts = membership.sum(axis=0)[:, None]
+            # Los grupos que se quedan vacíos conservan su centroide anterior
+            new_centroids = np.where(
+                counts > 0,
+                membership.T @ matrix / np.maximum(counts, 1),
+                centroids
+            )
+            if np.allclose(new_centroids, centroids):
+                break
+            centroids = new_centroids
+            
+        distances = squared_norms - 2 * matrix @ centroids.T + (centroids * centroids).sum(axis=1)
+        return centroids, distances.argmin(axis=1)
         
     def _export_to_json(self, bots: List[Bot], file_path: str) -> Tuple[bool, str]:
         """Exporta bots a formato JSON"""
         try:
-            data = {bot.name: bot.to_dict() for bot in bots}
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Formato de intercambio etiquetado por rasgo; el formato compacto de
+            # Bot.to_dict() es solo para el almacenamiento del repositorio
+            data = {
+                bot.name: {'name': bot.name, 'personality': bot.personality.to_dict()}
+                for bot in bots
+            }
+            # Serializar en memoria y escribir el resultado en una sola llamada
+            Path(file_path).write_text(
+                json.dumps(data, indent=2, ensure_ascii=False),
+                encoding='utf-8'
+            )
             return True, "Exportación JSON exitosa"
         except Exception as e:
             return False, f"Error en exportación JSON: {str(e)}"
@@ -253,19 +466,16 @@ class BotService:
     def _export_to_csv(self, bots: List[Bot], file_path: str) -> Tuple[bool, str]:
         """Exporta bots a formato CSV"""
         try:
-            with open(file_path, 'w', newline='', encoding='utf-8') as f:
+            with open(file_path, 'w', newline='', encoding='utf-8', buffering=_EXPORT_BUFFER_SIZE) as f:
                 writer = csv.writer(f)
                 # Escribir encabezados
-                headers = ['name'] + list(Personality.FACTORS.keys())
-                writer.writerow(headers)
+                writer.writerow(['name', *Personality.CODES])
                 
-                # Escribir datos
-                for bot in bots:
-                    row = [bot.name] + [
-                        bot.personality.factors[code].value 
-                        for code in Personality.FACTORS.keys()
-                    ]
-                    writer.writerow(row)
+                # Escribir datos en un único lote
+                writer.writerows(
+                    [bot.name, *(bot.personality.factors[code].value for code in Personality.CODES)]
+                    for bot in bots
+                )
                     
             return True, "Exportación CSV exitosa"
         except Exception as e:
@@ -274,38 +484,50 @@ class BotService:
     def _import_from_json(self, file_path: str) -> Tuple[bool, str]:
         """Importa bots desde formato JSON"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = json.loads(Path(file_path).read_text(encoding='utf-8'))
+            bots = [
+                Bot.from_dict({'name': name, **bot_data})
+                for name, bot_data in data.items()
+            ]
+            version = self.repository.version
+            imported = self.repository.save_many(bots)
+            self._invalidate_statistics(version, *data.keys())
                 
-            for name, bot_data in data.items():
-                bot = Bot.from_dict({'name': name, **bot_data})
-                self.repository.save(bot)
-                
-            return True, f"Importados {len(data)} bots desde JSON"
+            return True, f"Importados {imported} bots desde JSON"
         except Exception as e:
             return False, f"Error en importación JSON: {str(e)}"
             
     def _import_from_csv(self, file_path: str) -> Tuple[bool, str]:
         """Importa bots desde formato CSV"""
         try:
-            imported = 0
             with open(file_path, 'r', newline='', encoding='utf-8') as f:
                 reader = csv.reader(f)
                 headers = next(reader)  # Leer encabezados
+                rows = [row for row in reader if row]
                 
-                for row in reader:
-                    name = row[0]
-                    personality = Personality()
-                    
-                    # Asignar valores de personalidad
-                    for i, code in enumerate(Personality.FACTORS.keys(), 1):
-                        if i < len(row):
-                            personality.factors[code].value = float(row[i])
-                            
-                    bot = Bot(name, personality)
-                    self.repository.save(bot)
-                    imported += 1
+            # Las columnas de rasgos se asignan por encabezado, no por posición
+            codes = headers[1:]
+            unknown = [code for code in codes if code not in Personality.FACTORS]
+            if unknown:
+                return False, f"Error en importación CSV: rasgos desconocidos {', '.join(unknown)}"
+                
+            # Conversión de todas las celdas numéricas en una sola operación. Las
+            # filas cortas se completan con 0.0 y las celdas sobrantes se ignoran
+            width = len(codes)
+            padding = ['0'] * width
+            values = np.array(
+                [(row[1:] + padding)[:width] for row in rows], dtype=np.float64
+            ).reshape(len(rows), width)
+            
+            bots = []
+            for row, row_values in zip(rows, values.tolist()):
+                personality = Personality()
+                personality.from_dict(dict(zip(codes, row_values)))
+                bots.append(Bot(row[0], personality))
                     
+            version = self.repository.version
+            imported = self.repository.save_many(bots)
+            self._invalidate_statistics(version, *(bot.name for bot in bots))
             return True, f"Importados {imported} bots desde CSV"
         except Exception as e:
             return False, f"Error en importación CSV: {str(e)}"
@@ -1,13 +1,15 @@
-from typing import Dict, List, Tuple, Optional
-from ..domain.entities.personality import Personality
+from typing import Dict, List, Mapping, Tuple, Optional
+from ..domain.entities.personality import Personality, order_by_magnitude
 from ..domain.value_objects.personality_factor import PersonalityFactor
 from ..infrastructure.config.settings import get_settings
-import random
 import math
-import logging
+import functools
+from ..infrastructure.logging_setup import get_queued_file_logger
 import numpy as np
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 
 class PersonalityTemplate(Enum):
     """Templates predefinidos de personalidad"""
@@ -20,70 +22,232 @@ class PersonalityTemplate(Enum):
     ADVENTUROUS = "adventurous"
     CAUTIOUS = "cautious"
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PersonalityAnalysis:
-    """Resultado del análisis de personalidad"""
-    dominant_traits: List[Tuple[str, float]]
-    trait_distribution: Dict[str, int]
+    """
+    Resultado del análisis de personalidad.
+    Es inmutable para que pueda compartirse entre llamadas desde la caché.
+    """
+    dominant_traits: Tuple[Tuple[str, float], ...]
+    trait_distribution: Mapping[str, int]
     personality_type: str
-    compatibility_scores: Dict[str, float]
-    behavioral_tendencies: Dict[str, float]
+    compatibility_scores: Mapping[str, float]
+    behavioral_tendencies: Mapping[str, float]
     decision_making_style: str
     social_orientation: str
     emotional_stability: float
     adaptability_score: float
 
+# Valores de cada plantilla que se apartan de neutral (0.0); el resto de factores queda en 0
+_LEADER_OVERRIDES = {
+    'A': 0.7,  # Cálido
+    'E': 0.8,  # Dominante
+    'H': 0.7,  # Atrevido
+    'L': 0.3,  # Vigilante
+    'O': -0.5, # Seguro
+    'Q2': 0.6, # Autosuficiente
+    'Q3': 0.7, # Perfeccionista
+}
+
+_CREATIVE_OVERRIDES = {
+    'B': 0.7,  # Abstracto
+    'M': 0.8,  # Imaginativo
+    'Q1': 0.8, # Abierto al cambio
+    'F': 0.6,  # Entusiasta
+}
+
+_ANALYTICAL_OVERRIDES = {
+    'B': 0.8,  # Abstracto
+    'G': 0.7,  # Cumplidor
+    'Q3': 0.7, # Perfeccionista
+    'M': 0.5,  # Imaginativo
+}
+
+_SOCIAL_OVERRIDES = {
+    'A': 0.8,  # Cálido
+    'F': 0.7,  # Entusiasta
+    'H': 0.7,  # Atrevido
+    'Q2': -0.6,# Orientado al grupo
+}
+
+_RESERVED_OVERRIDES = {
+    'A': -0.5, # Reservado
+    'F': -0.4, # Serio
+    'H': -0.5, # Tímido
+    'N': 0.6,  # Discreto
+}
+
+_ADVENTUROUS_OVERRIDES = {
+    'H': 0.8,  # Atrevido
+    'F': 0.7,  # Entusiasta
+    'Q1': 0.7, # Abierto al cambio
+    'E': 0.6,  # Dominante
+}
+
+_CAUTIOUS_OVERRIDES = {
+    'H': -0.6, # Tímido
+    'L': 0.6,  # Vigilante
+    'O': 0.5,  # Aprensivo
+    'F': -0.4, # Serio
+    'G': 0.7,  # Cumplidor
+}
+
+_TEMPLATE_OVERRIDES = {
+    PersonalityTemplate.NEUTRAL: {},
+    PersonalityTemplate.LEADER: _LEADER_OVERRIDES,
+    PersonalityTemplate.CREATIVE: _CREATIVE_OVERRIDES,
+    PersonalityTemplate.ANALYTICAL: _ANALYTICAL_OVERRIDES,
+    PersonalityTemplate.SOCIAL: _SOCIAL_OVERRIDES,
+    PersonalityTemplate.RESERVED: _RESERVED_OVERRIDES,
+    PersonalityTemplate.ADVENTUROUS: _ADVENTUROUS_OVERRIDES,
+    PersonalityTemplate.CAUTIOUS: _CAUTIOUS_OVERRIDES
+}
+
+# Peso de compatibilidad por defecto de cada factor y los factores que se apartan de él
+_DEFAULT_COMPATIBILITY_WEIGHTS = dict.fromkeys(Personality.FACTORS, 0.5)
+
+_COMPATIBILITY_WEIGHT_OVERRIDES = {
+    'A': 1.0,  # Afabilidad
+    'E': 0.8,  # Dominancia
+    'F': 0.7,  # Animación
+    'H': 0.9,  # Atrevimiento
+    'I': 0.6,  # Sensibilidad
+    'L': 0.8,  # Vigilancia
+    'N': 0.7,  # Privacidad
+    'Q2': 0.9, # Autosuficiencia
+}
+
 class PersonalityService:
     """
     Servicio que gestiona las operaciones relacionadas con personalidades.
     Proporciona funcionalidades para crear, analizar y modificar personalidades.
     """
     
+    # Pesos de cada factor en el cálculo de las tendencias de comportamiento
+    _TENDENCY_WEIGHTS = {
+        'risk_taking': {
+            'H': 0.3,  # Atrevimiento
+            'F': 0.2,  # Animación
+            'L': -0.1, # Vigilancia
+            'O': -0.2, # Aprensión
+            'Q1': 0.2  # Apertura al cambio
+        },
+        'sociability': {
+            'A': 0.3,  # Afabilidad
+            'F': 0.2,  # Animación
+            'H': 0.2,  # Atrevimiento
+            'Q2': -0.2,# Autosuficiencia
+            'N': -0.1  # Privacidad
+        },
+        'leadership': {
+            'E': 0.3,  # Dominancia
+            'L': 0.1,  # Vigilancia
+            'Q2': 0.2, # Autosuficiencia
+            'O': -0.2, # Aprensión
+            'H': 0.2   # Atrevimiento
+        },
+        'creativity': {
+            'M': 0.3,  # Abstracción
+            'Q1': 0.3, # Apertura al cambio
+            'B': 0.2,  # Razonamiento
+            'F': 0.1,  # Animación
+            'A': 0.1   # Afabilidad
+        },
+        'analytical': {
+            'B': 0.3,  # Razonamiento
+            'G': 0.2,  # Atención a normas
+            'Q3': 0.2, # Perfeccionismo
+            'M': -0.1, # Abstracción
+            'C': 0.2   # Estabilidad
+        },
+        'emotional_dependency': {
+            'C': -0.3, # Estabilidad
+            'O': 0.3,  # Aprensión
+            'Q4': 0.2, # Tensión
+            'I': 0.2,  # Sensibilidad
+        },
+        'emotional_stability': {
+            'C': 0.5,  # Estabilidad
+            'O': 0.3,  # Aprensión
+            'Q4': 0.2  # Tensión
+        },
+        'adaptability': {
+            'Q1': 0.4, # Apertura al cambio
+            'F': 0.3,  # Animación
+            'E': 0.3   # Dominancia
+        }
+    }
+    
+    # Tendencias que se reportan como tendencias de comportamiento
+    _BEHAVIORAL_TENDENCIES = ('risk_taking', 'sociability', 'leadership', 'creativity', 'analytical')
+    
+    # Nombre descriptivo de cada factor
+    _FACTOR_DISPLAY_NAMES = {code: name for code, (name, _, _) in Personality.FACTORS.items()}
+    
+    # Filas por bloque en la matriz de compatibilidad: acota la memoria temporal
+    # a bloque * N * 16 valores en lugar de N * N * 16
+    _COMPAT_CHUNK_ROWS = 256
+    
+    # Número máximo de análisis recordados
+    _ANALYSIS_CACHE_SIZE = 1024
+    
     def __init__(self):
         self.settings = get_settings()
         self._setup_logging()
         self._load_templates()
         
+        # Generador aleatorio compartido para valores y variaciones de personalidad
+        self._rng = np.random.default_rng()
+        
+        # Análisis recientes indexados por los bytes de los valores de personalidad;
+        # cualquier cambio en los valores produce una clave distinta
+        self._analysis_cache: OrderedDict[bytes, PersonalityAnalysis] = OrderedDict()
+        
     def _setup_logging(self):
-        """Configura el sistema de logging"""
-        self.logger = logging.getLogger(__name__)
-        if not self.logger.handlers:
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler = logging.FileHandler('personality_service.log')
-            handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
-            self.logger.setLevel(logging.INFO)
+        """Configura el sistema de logging, escrito en segundo plano"""
+        self.logger = get_queued_file_logger(__name__, 'personality_service.log')
             
     def _load_templates(self):
         """Carga las plantillas predefinidas de personalidad"""
+        # Matriz (n_plantillas, n_factores) con los valores de cada plantilla
+        self._template_matrix = np.zeros((len(_TEMPLATE_OVERRIDES), len(Personality.FACTORS)))
+        for row, overrides in enumerate(_TEMPLATE_OVERRIDES.values()):
+            for code, value in overrides.items():
+                self._template_matrix[row, Personality.CODE_INDEX[code]] = value
+                
+        # Cada plantilla se expone como una vista de su fila en la matriz
         self.templates = {
-            PersonalityTemplate.NEUTRAL: self._create_neutral_template(),
-            PersonalityTemplate.LEADER: self._create_leader_template(),
-            PersonalityTemplate.CREATIVE: self._create_creative_template(),
-            PersonalityTemplate.ANALYTICAL: self._create_analytical_template(),
-            PersonalityTemplate.SOCIAL: self._create_social_template(),
-            PersonalityTemplate.RESERVED: self._create_reserved_template(),
-            PersonalityTemplate.ADVENTUROUS: self._create_adventurous_template(),
-            PersonalityTemplate.CAUTIOUS: self._create_cautious_template()
+            template: self._template_matrix[row]
+            for row, template in enumerate(_TEMPLATE_OVERRIDES)
         }
+        self._template_names = [template.value for template in self.templates]
+        self._template_index = {template: row for row, template in enumerate(self.templates)}
+        
+        # Matriz (n_tendencias, n_factores) para calcular todas las tendencias con un solo producto
+        self._tendency_names = tuple(self._TENDENCY_WEIGHTS)
+        self._tendency_weights = np.zeros((len(self._tendency_names), len(Personality.FACTORS)))
+        for row, name in enumerate(self._tendency_names):
+            for code, weight in self._TENDENCY_WEIGHTS[name].items():
+                self._tendency_weights[row, Personality.CODE_INDEX[code]] = weight
+                
+        # Pesos de compatibilidad alineados con CODE_INDEX y la máxima diferencia ponderada posible
+        compatibility_weights = self._get_compatibility_weights()
+        self._compat_weights = np.array([compatibility_weights.get(code, 1.0) for code in Personality.FACTORS])
+        self._compat_weights_sum = self._compat_weights.sum() * 2
         
     def create_personality(self, template: Optional[PersonalityTemplate] = None) -> Personality:
         """Crea una nueva personalidad, opcionalmente basada en una plantilla"""
         personality = Personality()
         
         if template and template in self.templates:
-            base_template = self.templates[template]
-            for code, factor in personality.factors.items():
-                factor.value = base_template[code]
-                # Añadir variación aleatoria para mayor naturalidad
-                variation = random.uniform(-0.1, 0.1)
-                factor.value = max(-1, min(1, factor.value + variation))
+            base_template = self._template_matrix[self._template_index[template]]
+            # Añadir variación aleatoria para mayor naturalidad
+            variation = self._rng.uniform(-0.1, 0.1, len(base_template))
+            np.clip(base_template + variation, -1, 1, out=personality._values)
         else:
             self.randomize_personality(personality)
             
-        self.logger.info(f"Personalidad creada con template: {template}")
+        self.logger.info("Personalidad creada con template: %s", template)
         return personality
         
     def randomize_personality(self, personality: Personality, 
@@ -92,40 +256,74 @@ class PersonalityService:
         Randomiza los valores de una personalidad.
         intensity: controla la intensidad de los valores (0.0 a 1.0)
         """
-        for factor in personality.factors.values():
-            factor.value = random.uniform(-1, 1) * intensity
+        values = personality._values
+        values[:] = self._rng.uniform(-1, 1, len(values))
+        values *= intensity
             
     def analyze_personality(self, personality: Personality) -> PersonalityAnalysis:
-        """Realiza un análisis completo de la personalidad"""
+        """
+        Realiza un análisis completo de la personalidad.
+        El resultado es inmutable y se comparte entre llamadas con los mismos valores.
+        """
+        key = personality._values.tobytes()
+        analysis = self._analysis_cache.get(key)
+        if analysis is not None:
+            self._analysis_cache.move_to_end(key)
+            return analysis
+            
+        analysis = self._build_analysis(personality)
+        self._analysis_cache[key] = analysis
+        if len(self._analysis_cache) > self._ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
+        return analysis
+        
+    def _build_analysis(self, personality: Personality) -> PersonalityAnalysis:
+        """Calcula el análisis de la personalidad sin pasar por la caché"""
+        tendencies = self._calculate_tendencies(personality)
         return PersonalityAnalysis(
-            dominant_traits=self._get_dominant_traits(personality),
-            trait_distribution=self._calculate_trait_distribution(personality),
+            dominant_traits=tuple(personality.dominant_traits()),
+            trait_distribution=MappingProxyType(personality.trait_distribution()),
             personality_type=self._determine_personality_type(personality),
-            compatibility_scores=self._calculate_compatibility_scores(personality),
-            behavioral_tendencies=self._analyze_behavioral_tendencies(personality),
-            decision_making_style=self._determine_decision_style(personality),
-            social_orientation=self._determine_social_orientation(personality),
-            emotional_stability=self._calculate_emotional_stability(personality),
-            adaptability_score=self._calculate_adaptability(personality)
+            compatibility_scores=MappingProxyType(self._calculate_compatibility_scores(personality)),
+            behavioral_tendencies=MappingProxyType(
+                {name: tendencies[name] for name in self._BEHAVIORAL_TENDENCIES}
+            ),
+            decision_making_style=self._determine_decision_style(tendencies),
+            social_orientation=self._determine_social_orientation(tendencies),
+            emotional_stability=tendencies['emotional_stability'],
+            adaptability_score=tendencies['adaptability']
         )
         
     def calculate_compatibility(self, personality1: Personality, 
                               personality2: Personality) -> float:
         """Calcula la compatibilidad entre dos personalidades"""
-        compatibility_score = 0.0
-        factor_weights = self._get_compatibility_weights()
+        diff = np.abs(personality1._values - personality2._values)
         
-        for code in personality1.factors.keys():
-            factor_diff = abs(personality1.factors[code].value - 
-                            personality2.factors[code].value)
-            weighted_diff = factor_diff * factor_weights.get(code, 1.0)
-            compatibility_score += weighted_diff
-            
         # Normalizar score (0 = idénticos, 1 = opuestos)
-        max_possible_diff = sum(factor_weights.values()) * 2
-        normalized_score = 1 - (compatibility_score / max_possible_diff)
+        return float(1 - (diff @ self._compat_weights) / self._compat_weights_sum)
         
-        return normalized_score
+    def calculate_compatibility_matrix(self, personalities: List[Personality]) -> np.ndarray:
+        """
+        Calcula la compatibilidad entre todos los pares de personalidades.
+        Retorna una matriz (N, N) donde el elemento [i, j] equivale a
+        calculate_compatibility(personalities[i], personalities[j]).
+        """
+        values = self._stack_values(personalities)
+        n = len(values)
+        weighted_diff = np.empty((n, n))
+        
+        for start in range(0, n, self._COMPAT_CHUNK_ROWS):
+            block = values[start:start + self._COMPAT_CHUNK_ROWS]
+            diff = np.abs(block[:, None, :] - values[None, :, :])
+            weighted_diff[start:start + len(block)] = diff @ self._compat_weights
+            
+        return 1 - weighted_diff / self._compat_weights_sum
+        
+    def _stack_values(self, personalities: List[Personality]) -> np.ndarray:
+        """Apila los valores de varias personalidades en una matriz (N, 16)"""
+        if not personalities:
+            return np.empty((0, len(Personality.FACTORS)))
+        return np.stack([personality._values for personality in personalities])
         
     def merge_personalities(self, personality1: Personality, personality2: Personality, 
                           weight1: float = 0.5) -> Personality:
@@ -136,62 +334,54 @@ class PersonalityService:
         weight2 = 1 - weight1
         result = Personality()
         
-        for code in personality1.factors.keys():
-            value1 = personality1.factors[code].value
-            value2 = personality2.factors[code].value
-            result.factors[code].value = value1 * weight1 + value2 * weight2
+        np.multiply(personality1._values, weight1, out=result._values)
+        result._values += personality2._values * weight2
             
         return result
         
+    def merge_personalities_batch(self, values1: np.ndarray, values2: np.ndarray,
+                                  weight1: float = 0.5) -> np.ndarray:
+        """
+        Combina por filas dos matrices (N, 16) de valores de personalidad.
+        Equivale a merge_personalities aplicado a cada par de filas.
+        """
+        result = np.multiply(values1, weight1)
+        result += np.multiply(values2, 1 - weight1)
+        return result
+        
     def evolve_personality(self, personality: Personality, 
                           experiences: List[Dict[str, float]]) -> None:
         """
         Evoluciona una personalidad basada en experiencias.
         experiences: lista de diccionarios con impactos en factores
         """
+        if experiences:
+            impacts = np.array([self._experience_to_vector(experience) for experience in experiences])
+            self.evolve_personality_vectorized(personality, impacts)
+            
+    def evolve_personality_vectorized(self, personality: Personality, impacts: np.ndarray) -> None:
+        """
+        Evoluciona una personalidad a partir de una matriz (n_experiencias, 16)
+        de impactos alineada con Personality.CODE_INDEX.
+        """
         learning_rate = self.settings.get().personality.learning_rate
+        values = personality._values
         
-        for experience in experiences:
-            for code, impact in experience.items():
-                if code in personality.factors:
-                    current = personality.factors[code].value
-                    change = impact * learning_rate
-                    personality.factors[code].value = max(-1, min(1, current + change))
+        # Las experiencias se aplican en orden y se recorta tras cada una,
+        # igual que al aplicarlas de una en una
+        for impact in np.atleast_2d(impacts):
+            values += impact * learning_rate
+            np.clip(values, -1, 1, out=values)
+            
+    def _experience_to_vector(self, experience: Dict[str, float]) -> np.ndarray:
+        """Convierte una experiencia en un vector de impactos; los códigos desconocidos se ignoran"""
+        vector = np.zeros(len(Personality.FACTORS))
+        for code, impact in experience.items():
+            index = Personality.CODE_INDEX.get(code)
+            if index is not None:
+                vector[index] += impact
+        return vector
                     
-    def _get_dominant_traits(self, personality: Personality, 
-                           threshold: float = 0.7) -> List[Tuple[str, float]]:
-        """Identifica los rasgos dominantes de la personalidad"""
-        dominant = []
-        for code, factor in personality.factors.items():
-            if abs(factor.value) > threshold:
-                dominant.append((code, factor.value))
-        return sorted(dominant, key=lambda x: abs(x[1]), reverse=True)
-        
-    def _calculate_trait_distribution(self, personality: Personality) -> Dict[str, int]:
-        """Calcula la distribución de rasgos por intensidad"""
-        distribution = {
-            'very_low': 0,   # < -0.7
-            'low': 0,        # -0.7 to -0.3
-            'neutral': 0,    # -0.3 to 0.3
-            'high': 0,       # 0.3 to 0.7
-            'very_high': 0   # > 0.7
-        }
-        
-        for factor in personality.factors.values():
-            value = factor.value
-            if value < -0.7:
-                distribution['very_low'] += 1
-            elif value < -0.3:
-                distribution['low'] += 1
-            elif value < 0.3:
-                distribution['neutral'] += 1
-            elif value < 0.7:
-                distribution['high'] += 1
-            else:
-                distribution['very_high'] += 1
-                
-        return distribution
-        
     def _determine_personality_type(self, personality: Personality) -> str:
         """Determina el tipo de personalidad basado en rasgos dominantes"""
         # Implementar lógica de clasificación según los requisitos específicos
@@ -199,40 +389,28 @@ class PersonalityService:
         
     def _calculate_compatibility_scores(self, personality: Personality) -> Dict[str, float]:
         """Calcula compatibilidad con diferentes templates"""
-        scores = {}
-        for template_name, template_values in self.templates.items():
-            score = 0.0
-            for code, value in template_values.items():
-                factor_diff = abs(personality.factors[code].value - value)
-                score += factor_diff
-            scores[template_name.value] = 1 - (score / len(template_values))
-        return scores
+        diffs = np.abs(self._template_matrix - personality._values)
+        scores = 1 - diffs.mean(axis=1)
+        return dict(zip(self._template_names, scores.tolist()))
         
-    def _analyze_behavioral_tendencies(self, personality: Personality) -> Dict[str, float]:
-        """Analiza tendencias de comportamiento basadas en la personalidad"""
-        return {
-            'risk_taking': self._calculate_risk_taking(personality),
-            'sociability': self._calculate_sociability(personality),
-            'leadership': self._calculate_leadership(personality),
-            'creativity': self._calculate_creativity(personality),
-            'analytical': self._calculate_analytical_tendency(personality)
-        }
+    def _calculate_tendencies(self, personality: Personality) -> Dict[str, float]:
+        """Calcula todas las tendencias con un único producto matriz-vector"""
+        scores = self._tendency_weights @ personality._values
+        np.clip(scores, -1.0, 1.0, out=scores)
+        return dict(zip(self._tendency_names, scores.tolist()))
         
-    def _determine_decision_style(self, personality: Personality) -> str:
+    def _determine_decision_style(self, tendencies: Dict[str, float]) -> str:
         """Determina el estilo de toma de decisiones"""
-        analytical = self._calculate_analytical_tendency(personality)
-        emotional = self._calculate_emotional_dependency(personality)
-        
-        if analytical > 0.7:
+        if tendencies['analytical'] > 0.7:
             return "Logical"
-        elif emotional > 0.7:
+        elif tendencies['emotional_dependency'] > 0.7:
             return "Emotional"
         else:
             return "Balanced"
             
-    def _determine_social_orientation(self, personality: Personality) -> str:
+    def _determine_social_orientation(self, tendencies: Dict[str, float]) -> str:
         """Determina la orientación social"""
-        sociability = self._calculate_sociability(personality)
+        sociability = tendencies['sociability']
         
         if sociability > 0.7:
             return "Extroverted"
@@ -241,232 +419,16 @@ class PersonalityService:
         else:
             return "Ambivert"
             
-    def _calculate_emotional_stability(self, personality: Personality) -> float:
-        """Calcula la estabilidad emocional"""
-        relevant_factors = ['C', 'O', 'Q4']  # Factores relevantes de Cattell
-        weights = {'C': 0.5, 'O': 0.3, 'Q4': 0.2}
-        
-        stability = 0.0
-        for factor, weight in weights.items():
-            if factor in personality.factors:
-                stability += personality.factors[factor].value * weight
-                
-        return max(-1, min(1, stability))
-        
-    def _calculate_adaptability(self, personality: Personality) -> float:
-        """Calcula la capacidad de adaptación"""
-        relevant_factors = ['Q1', 'F', 'E']
-        weights = {'Q1': 0.4, 'F': 0.3, 'E': 0.3}
-        
-        adaptability = 0.0
-        for factor, weight in weights.items():
-            if factor in personality.factors:
-                adaptability += personality.factors[factor].value * weight
-                
-        return max(-1, min(1, adaptability))
-        
-    # Templates predefinidos
-    def _create_neutral_template(self) -> Dict[str, float]:
-        return {code: 0.0 for code in Personality.FACTORS.keys()}
-        
-    def _create_leader_template(self) -> Dict[str, float]:
-        return {
-            'A': 0.7,  # Cálido
-            'E': 0.8,  # Dominante
-            'H': 0.7,  # Atrevido
-            'L': 0.3,  # Vigilante
-            'O': -0.5, # Seguro
-            'Q2': 0.6, # Autosuficiente
-            'Q3': 0.7, # Perfeccionista
-            # ... otros factores en valores neutrales
-            **{code: 0.0 for code in Personality.FACTORS.keys() 
-               if code not in ['A', 'E', 'H', 'L', 'O', 'Q2', 'Q3']}
-        }
-        
-    def _create_creative_template(self) -> Dict[str, float]:
-        return {
-            'B': 0.7,  # Abstracto
-            'M': 0.8,  # Imaginativo
-            'Q1': 0.8, # Abierto al cambio
-            'F': 0.6,  # Entusiasta
-            # ... otros factores
-            **{code: 0.0 for code in Personality.FACTORS.keys() 
-               if code not in ['B', 'M', 'Q1', 'F']}
-        }
-        
-    def _create_analytical_template(self) -> Dict[str, float]:
-        return {
-            'B': 0.8,  # Abstracto
-            'G': 0.7,  # Cumplidor
-            'Q3': 0.7, # Perfeccionista
-            'M': 0.5,  # Imaginativo
-            # ... otros factores
-            **{code: 0.0 for code in Personality.FACTORS.keys() 
-               if code not in ['B', 'G', 'Q3', 'M']}
-        }
-        
-    def _create_social_template(self) -> Dict[str, float]:
-        return {
-            'A': 0.8,  # Cálido
-            'F': 0.7,  # Entusiasta
-            'H': 0.7,  # Atrevido
-            'Q2': -0.6,# Orientado al grupo
-            # ... otros factores
-            **{code: 0.0 for code in Personality.FACTORS.keys() 
-               if code not in ['A', 'F', 'H', 'Q2']}
-        }
-        
-    def _create_reserved_template(self) -> Dict[str, float]:
-        return {
-            'A': -0.5, # Reservado
-            'F': -0.4, # Serio
-            'H': -0.5, # Tímido
-            'N': 0.6,  # Discreto
-            # ... otros factores
-            **{code: 0.0 for code in Personality.FACTORS.keys() 
-               if code not in ['A', 'F', 'H', 'N']}
-        }
-        
-    def _create_adventurous_template(self) -> Dict[str, float]:
-        return {
-            'H': 0.8,  # Atrevido
-            'F': 0.7,  # Entusiasta
-            'Q1': 0.7, # Abierto al cambio
-            'E': 0.6,  # Dominante
-            # ... otros factores
-            **{code: 0.0 for code in Personality.FACTORS.keys() 
-               if code not in ['H', 'F', 'Q1', 'E']}
-        }
-        
-    def _create_cautious_template(self) -> Dict[str, float]:
-        return {
-            'H': -0.6, # Tímido
-            'L': 0.6,  # Vigilante
-            'O': 0.5,  # Aprensivo
-            'F': -0.4, # Serio
-            'G': 0.7,  # Cumplidor
-            # ... otros factores
-            **{code: 0.0 for code in Personality.FACTORS.keys() 
-               if code not in ['H', 'L', 'O', 'F', 'G']}
-        }
-        
-    # Métodos de cálculo de tendencias
-    def _calculate_risk_taking(self, personality: Personality) -> float:
-        """Calcula la tendencia a tomar riesgos"""
-        weights = {
-            'H': 0.3,  # Atrevimiento
-            'F': 0.2,  # Animación
-            'L': -0.1, # Vigilancia
-            'O': -0.2, # Aprensión
-            'Q1': 0.2  # Apertura al cambio
-        }
-        
-        score = 0.0
-        for factor, weight in weights.items():
-            if factor in personality.factors:
-                score += personality.factors[factor].value * weight
-                
-        return max(-1, min(1, score))
-        
-    def _calculate_sociability(self, personality: Personality) -> float:
-        """Calcula el nivel de sociabilidad"""
-        weights = {
-            'A': 0.3,  # Afabilidad
-            'F': 0.2,  # Animación
-            'H': 0.2,  # Atrevimiento
-            'Q2': -0.2,# Autosuficiencia
-            'N': -0.1  # Privacidad
-        }
-        
-        score = 0.0
-        for factor, weight in weights.items():
-            if factor in personality.factors:
-                score += personality.factors[factor].value * weight
-                
-        return max(-1, min(1, score))
-        
-    def _calculate_leadership(self, personality: Personality) -> float:
-        """Calcula la tendencia al liderazgo"""
-        weights = {
-            'E': 0.3,  # Dominancia
-            'L': 0.1,  # Vigilancia
-            'Q2': 0.2, # Autosuficiencia
-            'O': -0.2, # Aprensión
-            'H': 0.2   # Atrevimiento
-        }
-        
-        score = 0.0
-        for factor, weight in weights.items():
-            if factor in personality.factors:
-                score += personality.factors[factor].value * weight
-                
-        return max(-1, min(1, score))
-        
-    def _calculate_creativity(self, personality: Personality) -> float:
-        """Calcula el nivel de creatividad"""
-        weights = {
-            'M': 0.3,  # Abstracción
-            'Q1': 0.3, # Apertura al cambio
-            'B': 0.2,  # Razonamiento
-            'F': 0.1,  # Animación
-            'A': 0.1   # Afabilidad
-        }
-        
-        score = 0.0
-        for factor, weight in weights.items():
-            if factor in personality.factors:
-                score += personality.factors[factor].value * weight
-                
-        return max(-1, min(1, score))
-        
-    def _calculate_analytical_tendency(self, personality: Personality) -> float:
-        """Calcula la tendencia analítica"""
-        weights = {
-            'B': 0.3,  # Razonamiento
-            'G': 0.2,  # Atención a normas
-            'Q3': 0.2, # Perfeccionismo
-            'M': -0.1, # Abstracción
-            'C': 0.2   # Estabilidad
-        }
-        
-        score = 0.0
-        for factor, weight in weights.items():
-            if factor in personality.factors:
-                score += personality.factors[factor].value * weight
-                
-        return max(-1, min(1, score))
-        
-    def _calculate_emotional_dependency(self, personality: Personality) -> float:
-        """Calcula la dependencia emocional"""
-        weights = {
-            'C': -0.3, # Estabilidad
-            'O': 0.3,  # Aprensión
-            'Q4': 0.2, # Tensión
-            'I': 0.2,  # Sensibilidad
-        }
-        
-        score = 0.0
-        for factor, weight in weights.items():
-            if factor in personality.factors:
-                score += personality.factors[factor].value * weight
-                
-        return max(-1, min(1, score))
-        
-    def _get_compatibility_weights(self) -> Dict[str, float]:
-        """Retorna los pesos para el cálculo de compatibilidad"""
-        return {
-            'A': 1.0,  # Afabilidad
-            'E': 0.8,  # Dominancia
-            'F': 0.7,  # Animación
-            'H': 0.9,  # Atrevimiento
-            'I': 0.6,  # Sensibilidad
-            'L': 0.8,  # Vigilancia
-            'N': 0.7,  # Privacidad
-            'Q2': 0.9, # Autosuficiencia
-            # Valores por defecto para otros factores
-            **{code: 0.5 for code in Personality.FACTORS.keys() 
-               if code not in ['A', 'E', 'F', 'H', 'I', 'L', 'N', 'Q2']}
-        }
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _get_compatibility_weights() -> Mapping[str, float]:
+        """
+        Retorna los pesos para el cálculo de compatibilidad.
+        Se construyen una sola vez y se comparten como una vista de solo lectura.
+        """
+        weights = _DEFAULT_COMPATIBILITY_WEIGHTS.copy()
+        weights.update(_COMPATIBILITY_WEIGHT_OVERRIDES)
+        return MappingProxyType(weights)
         
     def generate_personality_description(self, personality: Personality) -> str:
         """Genera una descripción en lenguaje natural de la personalidad"""
@@ -483,7 +445,7 @@ class PersonalityService:
         # Rasgos dominantes
         if analysis.dominant_traits:
             traits_desc = ", ".join(
-                f"{Personality.FACTORS[code][0]}: {value:+.2f}"
+                f"{self._FACTOR_DISPLAY_NAMES[code]}: {value:+.2f}"
                 for code, value in analysis.dominant_traits[:3]
             )
             description_parts.append(f"Los rasgos más destacados son: {traits_desc}.")
@@ -497,14 +459,12 @@ class PersonalityService:
         
         # Tendencias conductuales
         tendencies = analysis.behavioral_tendencies
-        high_tendencies = [
-            (k, v) for k, v in tendencies.items() 
-            if abs(v) > 0.5
-        ]
-        if high_tendencies:
+        names = list(tendencies)
+        order = order_by_magnitude(np.fromiter(tendencies.values(), np.float64, len(names)), 0.5)
+        if order:
             tendencies_desc = ", ".join(
-                f"{k} ({v:+.2f})"
-                for k, v in sorted(high_tendencies, key=lambda x: abs(x[1]), reverse=True)
+                f"{names[i]} ({tendencies[names[i]]:+.2f})"
+                for i in order
             )
             description_parts.append(
                 f"Las tendencias conductuales más marcadas son: {tendencies_desc}."
@@ -518,15 +478,10 @@ class PersonalityService:
         target_template: PersonalityTemplate
     ) -> Dict[str, float]:
         """Sugiere ajustes para acercar la personalidad a un template objetivo"""
-        target_values = self.templates[target_template]
-        adjustments = {}
-        
-        for code, target in target_values.items():
-            current = personality.factors[code].value
-            if abs(current - target) > 0.2:  # Umbral de diferencia significativa
-                adjustments[code] = target - current
-                
-        return adjustments
+        diff = self.templates[target_template] - personality._values
+        # Umbral de diferencia significativa
+        significant = np.flatnonzero(np.abs(diff) > 0.2).tolist()
+        return {Personality.CODES[i]: float(diff[i]) for i in significant}
 
 if __name__ == "__main__":
     # Código de prueba
@@ -4,6 +4,8 @@ from ..services.emotional_manager import EmotionalManager
 from ..services.stimulus_processor import StimulusProcessor
 
 class Bot:
+    __slots__ = ('name', 'personality', 'needs_manager', 'emotional_manager', 'stimulus_processor')
+    
     def __init__(self, name: str, personality: Personality):
         self.name = name
         self.personality = personality
@@ -15,14 +17,25 @@ class Bot:
             self.personality  # Añadimos la personalidad aquí
         )
     
+    # Versión 1: personalidad como {código: valor}
+    # Versión 2: personalidad como lista de valores en el orden de Personality.CODE_INDEX
+    FORMAT_VERSION = 2
+    
     def to_dict(self) -> dict:
         return {
+            'version': self.FORMAT_VERSION,
             'name': self.name,
-            'personality': self.personality.to_dict()
+            'personality': self.personality.values.tolist()
         }
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Bot':
         personality = Personality()
-        personality.from_dict(data['personality'])
+        if data.get('version', 1) >= 2:
+            values = data['personality']
+            if len(values) != len(Personality.CODE_INDEX):
+                raise ValueError(f"Se esperaban {len(Personality.CODE_INDEX)} valores de personalidad")
+            personality.values[:] = values
+        else:
+            personality.from_dict(data['personality'])
         return cls(data['name'], personality)
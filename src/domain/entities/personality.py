@@ -1,7 +1,17 @@
 # TODO: Implement Personality Entity
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from ..value_objects.personality_factor import PersonalityFactor
 import random
+import numpy as np
+
+def order_by_magnitude(values: np.ndarray, threshold: float) -> List[int]:
+    """
+    Posiciones de los valores cuya magnitud supera threshold, de mayor a menor magnitud.
+    Orden estable: a igual intensidad se respeta el orden de entrada.
+    """
+    magnitudes = np.abs(values)
+    selected = np.flatnonzero(magnitudes > threshold)
+    return selected[np.argsort(-magnitudes[selected], kind='stable')].tolist()
 
 class Personality:
     FACTORS = {
@@ -22,23 +32,69 @@ class Personality:
         'Q3': ('Perfeccionismo', 'Flexible', 'Perfeccionista'),
         'Q4': ('Tensión', 'Relajado', 'Tenso')
     }
+    
+    __slots__ = ('factors', '_values')
+    
+    # Posición de cada rasgo dentro del array de valores
+    CODE_INDEX = {code: i for i, code in enumerate(FACTORS)}
+    # Códigos de los rasgos en ese mismo orden
+    CODES = tuple(FACTORS)
+    # Pares (código, (nombre, polo bajo, polo alto)) en el orden de FACTORS
+    _FACTORS_ITEMS = tuple(FACTORS.items())
+    
+    # Intervalos de intensidad de los rasgos: < -0.7, -0.7 a -0.3, -0.3 a 0.3, 0.3 a 0.7, >= 0.7
+    DISTRIBUTION_EDGES = np.array([-0.7, -0.3, 0.3, 0.7])
+    DISTRIBUTION_LABELS = ('very_low', 'low', 'neutral', 'high', 'very_high')
 
     def __init__(self):
+        # Valores de todos los rasgos en un único array contiguo, en el orden de FACTORS.
+        # Se usa float64 para que los valores se conserven exactos al serializar.
+        self._values = np.zeros(len(self.FACTORS))
         self.factors: Dict[str, PersonalityFactor] = {}
         self._initialize_factors()
     
     def _initialize_factors(self):
+        # Cada factor es una vista sobre su posición en self._values
         for code, (name, low, high) in self.FACTORS.items():
-            self.factors[code] = PersonalityFactor(code, name, low, high)
+            self.factors[code] = PersonalityFactor(
+                code, name, low, high,
+                storage=self._values, index=self.CODE_INDEX[code]
+            )
+    
+    @property
+    def values(self) -> np.ndarray:
+        """Array con los valores de todos los rasgos, en el orden de CODE_INDEX"""
+        return self._values
+    
+    def __getitem__(self, code: str) -> PersonalityFactor:
+        return self.factors[code]
     
     def randomize(self):
         for factor in self.factors.values():
             factor.value = round(random.uniform(-1, 1), 2)
     
+    def dominant_traits(self, threshold: float = 0.7) -> List[Tuple[str, float]]:
+        """Rasgos cuya intensidad supera threshold, como pares (código, valor) de mayor a menor intensidad"""
+        order = order_by_magnitude(self._values, threshold)
+        return list(zip([self.CODES[i] for i in order], self._values[order].tolist()))
+    
+    def trait_distribution(self) -> Dict[str, int]:
+        """Número de rasgos en cada intervalo de intensidad de DISTRIBUTION_LABELS"""
+        counts = np.bincount(
+            np.digitize(self._values, self.DISTRIBUTION_EDGES),
+            minlength=len(self.DISTRIBUTION_LABELS)
+        )
+        return dict(zip(self.DISTRIBUTION_LABELS, counts.tolist()))
+    
     def to_dict(self) -> dict:
-        return {code: factor.value for code, factor in self.factors.items()}
+        return dict(zip(self.CODES, self._values.tolist()))
     
     def from_dict(self, data: dict):
+        # Con todos los rasgos presentes se asignan de una vez; si no, solo los indicados
+        if data.keys() >= self.CODE_INDEX.keys():
+            self._values[:] = [data[code] for code in self.CODES]
+            return
         for code, value in data.items():
-            if code in self.factors:
-                self.factors[code].value = value
\ No newline at end of file
+            index = self.CODE_INDEX.get(code)
+            if index is not None:
+                self._values[index] = value
\ No newline at end of file
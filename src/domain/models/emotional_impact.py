@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class EmotionalImpact:
     """Representa el impacto emocional del estímulo"""
     current_stability: float  # 0.0 a 1.0
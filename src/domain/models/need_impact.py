@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from .need_type import NeedType
 
-@dataclass
+@dataclass(slots=True)
 class NeedImpact:
     """Representa el impacto en una necesidad específica"""
     need_type: NeedType
@@ -1,10 +1,11 @@
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+import numpy as np
 from .need_type import NeedType
 from .need_impact import NeedImpact
 from .emotional_impact import EmotionalImpact
 
-@dataclass
+@dataclass(slots=True)
 class Stimulus:
     """Representa un estímulo con sus características e impactos"""
     type: str
@@ -21,18 +22,33 @@ class Stimulus:
     immediacy: float  # 0.0 a 1.0
     duration: float  # Duración del estímulo 0.0 a 1.0
     
+    # Intensidades y urgencias de need_impacts en arrays contiguos, en el mismo orden
+    _intensities: np.ndarray = field(init=False, repr=False, compare=False)
+    _urgencies: np.ndarray = field(init=False, repr=False, compare=False)
+    # Índice de impactos por tipo de necesidad
+    _by_need_type: Dict[NeedType, NeedImpact] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Se copia la lista para que los arrays no queden desfasados si el llamador la modifica
+        self.need_impacts = list(self.need_impacts)
+        count = len(self.need_impacts)
+        self._intensities = np.fromiter((impact.intensity for impact in self.need_impacts), np.float64, count)
+        self._urgencies = np.fromiter((impact.urgency for impact in self.need_impacts), np.float64, count)
+        
+        # Si un tipo aparece repetido prevalece el primer impacto, como en la búsqueda lineal
+        self._by_need_type = {}
+        for impact in self.need_impacts:
+            self._by_need_type.setdefault(impact.need_type, impact)
+    
     def get_need_impact(self, need_type: NeedType) -> Optional[NeedImpact]:
         """Obtiene el impacto para una necesidad específica"""
-        for impact in self.need_impacts:
-            if impact.need_type == need_type:
-                return impact
-        return None
+        return self._by_need_type.get(need_type)
 
     def get_highest_urgency_need(self) -> Optional[NeedImpact]:
         """Obtiene la necesidad con la mayor urgencia"""
         if not self.need_impacts:
             return None
-        return max(self.need_impacts, key=lambda x: x.urgency)
+        return self.need_impacts[int(np.argmax(self._urgencies))]
 
     def is_emotionally_destabilizing(self, stability_threshold: float = 0.5) -> bool:
         """Determina si el estímulo es emocionalmente desestabilizante"""
@@ -41,7 +57,7 @@ class Stimulus:
 
     def get_total_impact_score(self) -> float:
         """Calcula el impacto total del estímulo"""
-        need_score = sum(impact.intensity * impact.urgency for impact in self.need_impacts)
+        need_score = float(self._intensities @ self._urgencies)
         emotional_score = abs(self.emotional_impact.impact_intensity) * (1 - self.emotional_impact.current_stability)
         threat_score = self.threat_level * self.immediacy
         
@@ -1,7 +1,18 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict
+from enum import Enum, auto
+from typing import List, Optional, Dict, Tuple
 from ..entities.bot import Bot
+from ..entities.personality import Personality
+from ..services.population_state import BotPopulationState
 from datetime import datetime
+import numpy as np
+
+class WriteResult(Enum):
+    """Resultado de una operación de escritura condicional en el repositorio"""
+    SUCCESS = auto()
+    ALREADY_EXISTS = auto()
+    NOT_FOUND = auto()
+    ERROR = auto()
 
 class BotRepository(ABC):
     """
@@ -9,6 +20,22 @@ class BotRepository(ABC):
     Sigue los principios SOLID y permite diferentes implementaciones (JSON, SQL, etc.).
     """
 
+    # Contador de modificaciones; las implementaciones lo incrementan en cada escritura
+    _version = 0
+
+    @property
+    def version(self) -> int:
+        """
+        Versión de los datos del repositorio.
+        
+        Aumenta con cada modificación, sea cual sea su origen, de modo que
+        quien mantenga datos derivados puede detectar si siguen vigentes.
+        
+        Returns:
+            int: Número de modificaciones aplicadas desde la carga
+        """
+        return self._version
+
     @abstractmethod
     def save(self, bot: Bot) -> bool:
         """
@@ -22,6 +49,21 @@ class BotRepository(ABC):
         """
         pass
 
+    def save_many(self, bots: List[Bot]) -> int:
+        """
+        Guarda varios bots en el repositorio.
+        
+        Las implementaciones deberían sobrescribir este método para persistir
+        todo el lote en una sola operación de escritura.
+        
+        Args:
+            bots: Bots a guardar
+            
+        Returns:
+            int: Número de bots guardados correctamente
+        """
+        return sum(1 for bot in bots if self.save(bot))
+
     @abstractmethod
     def update(self, bot: Bot) -> bool:
         """
@@ -48,6 +90,66 @@ class BotRepository(ABC):
         """
         pass
 
+    def delete_many(self, names: List[str]) -> int:
+        """
+        Elimina varios bots del repositorio.
+        
+        Las implementaciones deberían sobrescribir este método para persistir
+        todo el lote en una sola operación de escritura.
+        
+        Args:
+            names: Nombres de los bots a eliminar
+            
+        Returns:
+            int: Número de bots eliminados correctamente
+        """
+        return sum(1 for name in names if self.delete(name))
+
+    def try_create(self, bot: Bot) -> WriteResult:
+        """
+        Guarda un bot solo si no existe otro con el mismo nombre.
+        
+        Las implementaciones deberían sobrescribir este método para comprobar
+        y escribir en una única operación atómica.
+        
+        Args:
+            bot: Bot a crear
+            
+        Returns:
+            WriteResult: SUCCESS, ALREADY_EXISTS o ERROR
+        """
+        if self.exists(bot.name):
+            return WriteResult.ALREADY_EXISTS
+        return WriteResult.SUCCESS if self.save(bot) else WriteResult.ERROR
+
+    def try_update(self, bot: Bot) -> WriteResult:
+        """
+        Actualiza un bot solo si existe.
+        
+        Args:
+            bot: Bot con los datos actualizados
+            
+        Returns:
+            WriteResult: SUCCESS, NOT_FOUND o ERROR
+        """
+        if not self.exists(bot.name):
+            return WriteResult.NOT_FOUND
+        return WriteResult.SUCCESS if self.update(bot) else WriteResult.ERROR
+
+    def try_delete(self, name: str) -> WriteResult:
+        """
+        Elimina un bot solo si existe.
+        
+        Args:
+            name: Nombre del bot a eliminar
+            
+        Returns:
+            WriteResult: SUCCESS, NOT_FOUND o ERROR
+        """
+        if not self.exists(name):
+            return WriteResult.NOT_FOUND
+        return WriteResult.SUCCESS if self.delete(name) else WriteResult.ERROR
+
     @abstractmethod
     def get(self, name: str) -> Optional[Bot]:
         """
@@ -105,10 +207,16 @@ class BotRepository(ABC):
         Returns:
             List[Bot]: Lista de bots que cumplen el criterio
         """
-        return [
-            bot for bot in self.get_all()
-            if bot.personality.factors.get(trait_code, 0.0) >= min_value
-        ]
+        index = Personality.CODE_INDEX.get(trait_code)
+        if index is None:
+            # Un rasgo desconocido se considera 0.0 en todos los bots
+            return list(self._get_factor_matrix()[0]) if 0.0 >= min_value else []
+            
+        bots, sorted_values, order = self._get_trait_index()
+        # Búsqueda binaria del primer valor >= min_value en la columna ordenada
+        start = np.searchsorted(sorted_values[index], min_value, side='left')
+        # Se devuelven en el orden del repositorio, no en el de los valores
+        return [bots[i] for i in np.sort(order[index][start:]).tolist()]
 
     def get_by_traits(self, traits: Dict[str, float]) -> List[Bot]:
         """
@@ -120,14 +228,33 @@ class BotRepository(ABC):
         Returns:
             List[Bot]: Lista de bots que cumplen todos los criterios
         """
-        all_bots = self.get_all()
-        return [
-            bot for bot in all_bots
-            if all(
-                bot.personality.factors.get(code, 0.0) >= value
-                for code, value in traits.items()
-            )
-        ]
+        all_bots, matrix = self._get_factor_matrix()
+        matches = np.ones(len(all_bots), dtype=bool)
+        for code, value in traits.items():
+            index = Personality.CODE_INDEX.get(code)
+            if index is not None:
+                matches &= matrix[:, index] >= value
+            elif 0.0 < value:
+                # Un rasgo desconocido se considera 0.0 en todos los bots
+                return []
+        return [all_bots[i] for i in np.flatnonzero(matches).tolist()]
+
+    def _get_trait_index(self) -> Tuple[List[Bot], np.ndarray, np.ndarray]:
+        """
+        Construye un índice ordenado por cada rasgo.
+        
+        Para cada rasgo (fila) se obtienen los valores de todos los bots en orden
+        ascendente y las posiciones de los bots correspondientes, de modo que un
+        umbral mínimo se resuelve con una búsqueda binaria.
+        
+        Returns:
+            Tuple[List[Bot], np.ndarray, np.ndarray]: Bots, valores ordenados (16, N)
+            y posiciones de los bots en ese orden (16, N)
+        """
+        bots, matrix = self._get_factor_matrix()
+        order = np.argsort(matrix, axis=0, kind='stable')
+        sorted_values = np.take_along_axis(matrix, order, axis=0)
+        return bots, sorted_values.T, order.T
 
     def get_similar_bots(self, reference_bot: Bot, 
                         threshold: float = 0.8) -> List[Bot]:
@@ -141,44 +268,47 @@ class BotRepository(ABC):
         Returns:
             List[Bot]: Lista de bots similares
         """
-        similar_bots = []
-        ref_factors = reference_bot.personality.factors
-        
-        for bot in self.get_all():
-            if bot.name == reference_bot.name:
-                continue
-                
-            similarity = self._calculate_similarity(
-                ref_factors,
-                bot.personality.factors
-            )
+        bots, matrix = self._get_factor_matrix()
+        if not bots:
+            return []
             
-            if similarity >= threshold:
-                similar_bots.append(bot)
-                
-        return similar_bots
+        # Similitud de todos los bots con la referencia en una sola operación
+        avg_differences = np.abs(matrix - reference_bot.personality._values).mean(axis=1)
+        similar = (1.0 - avg_differences / 2.0) >= threshold
+        
+        return [
+            bot for bot, is_similar in zip(bots, similar.tolist())
+            if is_similar and bot.name != reference_bot.name
+        ]
+
+    def _get_factor_matrix(self) -> Tuple[List[Bot], np.ndarray]:
+        """
+        Obtiene todos los bots junto con una matriz (N, 16) de sus valores de
+        personalidad, con las filas en el mismo orden que los bots.
+        
+        Las implementaciones con caché en memoria pueden sobrescribir este método
+        para reutilizar la matriz mientras no haya escrituras.
+        
+        Returns:
+            Tuple[List[Bot], np.ndarray]: Bots y matriz de valores
+        """
+        bots = self.get_all()
+        if not bots:
+            return bots, np.empty((0, len(Personality.FACTORS)))
+        return bots, np.stack([bot.personality._values for bot in bots])
 
-    def _calculate_similarity(self, factors1: Dict, factors2: Dict) -> float:
+    def _calculate_similarity(self, personality1: Personality, personality2: Personality) -> float:
         """
-        Calcula la similitud entre dos conjuntos de factores de personalidad.
+        Calcula la similitud entre dos personalidades.
         
         Args:
-            factors1: Primer conjunto de factores
-            factors2: Segundo conjunto de factores
+            personality1: Primera personalidad
+            personality2: Segunda personalidad
             
         Returns:
             float: Valor de similitud entre 0.0 y 1.0
         """
-        if not factors1 or not factors2:
-            return 0.0
-            
-        differences = []
-        for code in factors1.keys():
-            value1 = factors1[code].value
-            value2 = factors2[code].value if code in factors2 else 0.0
-            differences.append(abs(value1 - value2))
-            
-        avg_difference = sum(differences) / len(differences)
+        avg_difference = float(np.abs(personality1._values - personality2._values).mean())
         return 1.0 - (avg_difference / 2.0)  # Normalizado a [0,1]
 
     def get_metadata(self) -> Dict:
@@ -188,69 +318,77 @@ class BotRepository(ABC):
         Returns:
             Dict: Diccionario con metadatos del repositorio
         """
-        all_bots = self.get_all()
+        all_bots, matrix = self._get_factor_matrix()
         
         return {
             'total_bots': len(all_bots),
             'last_updated': datetime.now().isoformat(),
-            'trait_statistics': self._calculate_trait_statistics(all_bots),
-            'personality_types': self._analyze_personality_types(all_bots)
+            'trait_statistics': self._calculate_trait_statistics(matrix),
+            'personality_types': self._analyze_personality_types(matrix)
         }
 
-    def _calculate_trait_statistics(self, bots: List[Bot]) -> Dict:
+    def _calculate_trait_statistics(self, matrix: np.ndarray) -> Dict:
         """
         Calcula estadísticas sobre los rasgos de personalidad.
         
         Args:
-            bots: Lista de bots para analizar
+            matrix: Matriz (N, 16) con los valores de personalidad de los bots
             
         Returns:
             Dict: Estadísticas de los rasgos
         """
-        if not bots:
+        if not len(matrix):
             return {}
             
-        stats = {}
-        for code in bots[0].personality.factors.keys():
-            values = [bot.personality.factors[code].value for bot in bots]
-            stats[code] = {
-                'min': min(values),
-                'max': max(values),
-                'avg': sum(values) / len(values)
-            }
-            
-        return stats
+        mins = matrix.min(axis=0).tolist()
+        maxs = matrix.max(axis=0).tolist()
+        means = matrix.mean(axis=0).tolist()
+        return {
+            code: {'min': mins[i], 'max': maxs[i], 'avg': means[i]}
+            for code, i in Personality.CODE_INDEX.items()
+        }
 
-    def _analyze_personality_types(self, bots: List[Bot]) -> Dict:
+    def _analyze_personality_types(self, matrix: np.ndarray) -> Dict:
         """
         Analiza los tipos de personalidad presentes.
         
         Args:
-            bots: Lista de bots para analizar
+            matrix: Matriz (N, 16) con los valores de personalidad de los bots
             
         Returns:
             Dict: Distribución de tipos de personalidad
         """
-        type_counts = {
-            'balanced': 0,
-            'extreme': 0,
-            'specialized': 0
+        # Número de rasgos extremos de cada bot
+        extreme_traits = np.count_nonzero(np.abs(matrix) > 0.7, axis=1)
+        
+        balanced = int(np.count_nonzero(extreme_traits == 0))
+        extreme = int(np.count_nonzero(extreme_traits > 3))
+        return {
+            'balanced': balanced,
+            'extreme': extreme,
+            'specialized': len(matrix) - balanced - extreme
         }
+
+    def tick(self, delta_time: float) -> None:
+        """
+        Aplica el paso del tiempo a las necesidades de todos los bots a la vez.
         
-        for bot in bots:
-            extreme_traits = sum(
-                1 for factor in bot.personality.factors.values()
-                if abs(factor.value) > 0.7
-            )
-            
-            if extreme_traits == 0:
-                type_counts['balanced'] += 1
-            elif extreme_traits > 3:
-                type_counts['extreme'] += 1
-            else:
-                type_counts['specialized'] += 1
-                
-        return type_counts
+        Args:
+            delta_time: Tiempo transcurrido en segundos
+        """
+        self._get_population_state().tick(delta_time)
+
+    def _get_population_state(self) -> BotPopulationState:
+        """
+        Agrupa las necesidades de todos los bots en una matriz (N, 6).
+        
+        Las implementaciones con caché en memoria pueden sobrescribir este método
+        para reutilizar el estado mientras no cambie el conjunto de bots.
+        
+        Returns:
+            BotPopulationState: Estado de necesidades de la población
+        """
+        return BotPopulationState(self.get_all())
 
     @abstractmethod
     def create_backup(self) -> bool:
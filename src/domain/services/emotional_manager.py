@@ -1,20 +1,42 @@
+from bisect import bisect_right
+from types import MappingProxyType
+from typing import Mapping
 from ..models.emotional_state import EmotionalState
 
 class EmotionalManager:
     """Gestiona el estado emocional del bot"""
     
+    # Estados de menor a mayor intensidad
+    _STATE_ORDER = (
+        EmotionalState.CALM,
+        EmotionalState.ALERT,
+        EmotionalState.STRESSED,
+        EmotionalState.PANICKED
+    )
+    
+    # Impacto de estrés a partir del cual una amenaza produce ALERT, STRESSED y PANICKED
+    _THREAT_BOUNDS = (0.3, 0.6, 0.8)
+    
+    # Umbrales para cambios de estado, de solo lectura
+    _STRESS_THRESHOLDS = MappingProxyType({
+        EmotionalState.CALM: 0.3,
+        EmotionalState.ALERT: 0.5,
+        EmotionalState.STRESSED: 0.7,
+        EmotionalState.PANICKED: 0.9
+    })
+    
+    # Niveles de estrés a partir de los cuales se pasa a ALERT, STRESSED y PANICKED
+    _STATE_BOUNDS = tuple(map(_STRESS_THRESHOLDS.__getitem__, _STATE_ORDER[1:]))
+    
     def __init__(self):
         self.current_state = EmotionalState.CALM
         self.stability = 1.0  # 0.0 = inestable, 1.0 = completamente estable
         self.stress_level = 0.0  # 0.0 = sin estrés, 1.0 = estrés máximo
-        
-        # Umbrales para cambios de estado
-        self.stress_thresholds = {
-            EmotionalState.CALM: 0.3,
-            EmotionalState.ALERT: 0.5,
-            EmotionalState.STRESSED: 0.7,
-            EmotionalState.PANICKED: 0.9
-        }
+    
+    @property
+    def stress_thresholds(self) -> Mapping[EmotionalState, float]:
+        """Umbrales para cambios de estado; vista de solo lectura de los usados en _update_state"""
+        return self._STRESS_THRESHOLDS
     
     def update_emotional_state(self, stress_delta: float, recovery_rate: float = 0.1):
         """Actualiza el estado emocional basado en cambios de estrés"""
@@ -32,27 +54,13 @@ class EmotionalManager:
     
     def _update_state(self):
         """Actualiza el estado basado en el nivel de estrés actual"""
-        if self.stress_level >= self.stress_thresholds[EmotionalState.PANICKED]:
-            self.current_state = EmotionalState.PANICKED
-        elif self.stress_level >= self.stress_thresholds[EmotionalState.STRESSED]:
-            self.current_state = EmotionalState.STRESSED
-        elif self.stress_level >= self.stress_thresholds[EmotionalState.ALERT]:
-            self.current_state = EmotionalState.ALERT
-        else:
-            self.current_state = EmotionalState.CALM
+        self.current_state = self._STATE_ORDER[bisect_right(self._STATE_BOUNDS, self.stress_level)]
     
     def evaluate_threat(self, threat_level: float, immediacy: float) -> EmotionalState:
         """Evalúa una amenaza y determina el estado emocional resultante"""
         stress_impact = threat_level * immediacy
         
-        if stress_impact >= 0.8:
-            return EmotionalState.PANICKED
-        elif stress_impact >= 0.6:
-            return EmotionalState.STRESSED
-        elif stress_impact >= 0.3:
-            return EmotionalState.ALERT
-        else:
-            return EmotionalState.CALM
+        return self._STATE_ORDER[bisect_right(self._THREAT_BOUNDS, stress_impact)]
     
     def can_handle_stimulus(self, stimulus_intensity: float) -> bool:
         """Determina si el bot puede manejar un estímulo dado su estado actual"""
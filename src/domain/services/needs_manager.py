@@ -1,69 +1,103 @@
-from typing import Dict
+from collections.abc import Mapping
+from typing import Dict, Iterator
+import numpy as np
 from ..models.need_type import NeedType
 
+# Orden fijo de las necesidades dentro de los arrays de niveles
+NEED_ORDER = tuple(NeedType)
+NEED_IDX = {need_type: i for i, need_type in enumerate(NEED_ORDER)}
+
+# Peso de cada necesidad en la satisfacción general: las básicas pesan más
+_SATISFACTION_WEIGHTS = np.array([1.0 / need_type.value for need_type in NEED_ORDER])
+_INV_TOTAL_SATISFACTION_WEIGHT = 1.0 / _SATISFACTION_WEIGHTS.sum()
+
+# Umbrales críticos por defecto para cada necesidad
+_DEFAULT_CRITICAL_THRESHOLDS = {
+    NeedType.SURVIVAL: 0.2,      # Muy crítico
+    NeedType.PHYSIOLOGICAL: 0.3,
+    NeedType.SAFETY: 0.3,
+    NeedType.SOCIAL: 0.4,
+    NeedType.ESTEEM: 0.4,
+    NeedType.GROWTH: 0.5         # Menos crítico
+}
+
+# Tasas de decaimiento por defecto por necesidad por segundo
+# Considerando que 1.0 representa el máximo y queremos que tarden:
+# SURVIVAL: ~8 horas (28800 segundos) para llegar a crítico
+# PHYSIOLOGICAL: ~4 horas (14400 segundos) para llegar a crítico
+# SAFETY: ~12 horas (43200 segundos) para llegar a crítico
+# SOCIAL: ~24 horas (86400 segundos) para llegar a crítico
+# ESTEEM: ~48 horas (172800 segundos) para llegar a crítico
+# GROWTH: ~72 horas (259200 segundos) para llegar a crítico
+_DEFAULT_DECAY_RATES = {
+    NeedType.SURVIVAL: 0.00003,      # ~8 horas hasta crítico
+    NeedType.PHYSIOLOGICAL: 0.00005, # ~4 horas hasta crítico
+    NeedType.SAFETY: 0.00002,        # ~12 horas hasta crítico
+    NeedType.SOCIAL: 0.00001,        # ~24 horas hasta crítico
+    NeedType.ESTEEM: 0.000005,       # ~48 horas hasta crítico
+    NeedType.GROWTH: 0.000003        # ~72 horas hasta crítico
+}
+
+class _NeedArrayView(Mapping):
+    """
+    Vista de diccionario NeedType -> valor sobre uno de los arrays de un NeedsManager.
+    El array se busca en el gestor en cada acceso, porque BotPopulationState
+    lo reemplaza por una fila de su matriz.
+    """
+    
+    __slots__ = ('_manager', '_attribute')
+    
+    def __init__(self, manager: 'NeedsManager', attribute: str):
+        self._manager = manager
+        self._attribute = attribute
+        
+    def __getitem__(self, need_type: NeedType) -> float:
+        return float(getattr(self._manager, self._attribute)[NEED_IDX[need_type]])
+        
+    def __setitem__(self, need_type: NeedType, value: float):
+        getattr(self._manager, self._attribute)[NEED_IDX[need_type]] = value
+        
+    def __iter__(self) -> Iterator[NeedType]:
+        return iter(NEED_ORDER)
+        
+    def __len__(self) -> int:
+        return len(NEED_ORDER)
+
 class NeedsManager:
     """Gestiona las necesidades del bot y sus niveles"""
     
     def __init__(self):
-        # Inicializar necesidades con valores por defecto
-        self.needs = {need_type: 1.0 for need_type in NeedType}
+        # Niveles, umbrales críticos y tasas de decaimiento se guardan en arrays
+        # alineados con NEED_ORDER; needs, critical_thresholds y decay_rates son
+        # vistas de diccionario sobre ellos, así que no hay copias que sincronizar
+        self._levels = np.ones(len(NEED_ORDER))
+        self._critical = np.array([_DEFAULT_CRITICAL_THRESHOLDS[need_type] for need_type in NEED_ORDER])
+        self._decays = np.array([_DEFAULT_DECAY_RATES[need_type] for need_type in NEED_ORDER])
         
-        # Umbrales críticos para cada necesidad
-        self.critical_thresholds = {
-            NeedType.SURVIVAL: 0.2,      # Muy crítico
-            NeedType.PHYSIOLOGICAL: 0.3,
-            NeedType.SAFETY: 0.3,
-            NeedType.SOCIAL: 0.4,
-            NeedType.ESTEEM: 0.4,
-            NeedType.GROWTH: 0.5         # Menos crítico
-        }
-        
-        # Tasas de decaimiento por necesidad por segundo
-        # Considerando que 1.0 representa el máximo y queremos que tarden:
-        # SURVIVAL: ~8 horas (28800 segundos) para llegar a crítico
-        # PHYSIOLOGICAL: ~4 horas (14400 segundos) para llegar a crítico
-        # SAFETY: ~12 horas (43200 segundos) para llegar a crítico
-        # SOCIAL: ~24 horas (86400 segundos) para llegar a crítico
-        # ESTEEM: ~48 horas (172800 segundos) para llegar a crítico
-        # GROWTH: ~72 horas (259200 segundos) para llegar a crítico
-        
-        self.decay_rates = {
-            NeedType.SURVIVAL: 0.00003,      # ~8 horas hasta crítico
-            NeedType.PHYSIOLOGICAL: 0.00005, # ~4 horas hasta crítico
-            NeedType.SAFETY: 0.00002,        # ~12 horas hasta crítico
-            NeedType.SOCIAL: 0.00001,        # ~24 horas hasta crítico
-            NeedType.ESTEEM: 0.000005,       # ~48 horas hasta crítico
-            NeedType.GROWTH: 0.000003        # ~72 horas hasta crítico
-        }
+        self.needs = _NeedArrayView(self, '_levels')
+        self.critical_thresholds = _NeedArrayView(self, '_critical')
+        self.decay_rates = _NeedArrayView(self, '_decays')
     
     def update_needs(self, delta_time: float):
         """Actualiza los niveles de necesidad basado en el tiempo transcurrido"""
-        for need_type in NeedType:
-            decay = self.decay_rates[need_type] * delta_time
-            self.needs[need_type] = max(0.0, self.needs[need_type] - decay)
+        levels = self._levels
+        levels -= self._decays * delta_time
+        np.maximum(levels, 0.0, out=levels)
     
     def apply_impact(self, need_type: NeedType, impact: float):
         """Aplica un impacto a una necesidad específica"""
-        # Asegurarse de que need_type es una instancia de NeedType
-        if isinstance(need_type, str):
-            need_type = NeedType[need_type]
-            
-        if need_type in self.needs:
-            self.needs[need_type] = max(0.0, min(1.0, self.needs[need_type] + impact))
+        index = NEED_IDX[need_type]
+        self._levels[index] = max(0.0, min(1.0, self._levels[index] + impact))
+    
+    def apply_impact_by_name(self, need_name: str, impact: float):
+        """Aplica un impacto a una necesidad indicada por su nombre (p. ej. 'SAFETY')"""
+        self.apply_impact(NeedType[need_name], impact)
     
     def get_critical_needs(self) -> Dict[NeedType, float]:
         """Retorna las necesidades que están por debajo de su umbral crítico"""
-        return {
-            need_type: level 
-            for need_type, level in self.needs.items() 
-            if level < self.critical_thresholds[need_type]
-        }
+        critical = np.flatnonzero(self._levels < self._critical).tolist()
+        return {NEED_ORDER[i]: float(self._levels[i]) for i in critical}
     
     def get_satisfaction_level(self) -> float:
         """Retorna el nivel general de satisfacción de necesidades"""
-        weighted_sum = sum(
-            level * (1.0 / need_type.value)  # Necesidades básicas tienen más peso
-            for need_type, level in self.needs.items()
-        )
-        total_weights = sum(1.0 / need_type.value for need_type in NeedType)
-        return weighted_sum / total_weights
\ No newline at end of file
+        return float(_SATISFACTION_WEIGHTS @ self._levels) * _INV_TOTAL_SATISFACTION_WEIGHT
\ No newline at end of file
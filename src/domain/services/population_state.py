@@ -0,0 +1,52 @@
+from typing import Dict, List
+import numpy as np
+from ..entities.bot import Bot
+from ..models.need_type import NeedType
+from .needs_manager import NEED_ORDER
+
+class BotPopulationState:
+    """
+    Agrupa los niveles de necesidad de un conjunto de bots en una matriz (N, 6).
+
+    El NeedsManager de cada bot pasa a trabajar sobre una fila de cada matriz,
+    de modo que los cambios individuales (apply_impact, update_needs) y los
+    de toda la población (tick) comparten los mismos datos.
+    """
+
+    def __init__(self, bots: List[Bot]):
+        self.bots = list(bots)
+        managers = [bot.needs_manager for bot in self.bots]
+        n_needs = len(NEED_ORDER)
+
+        if managers:
+            self.levels_matrix = np.stack([manager._levels for manager in managers])
+            self.decay_matrix = np.stack([manager._decays for manager in managers])
+            self.critical_matrix = np.stack([manager._critical for manager in managers])
+        else:
+            self.levels_matrix = np.empty((0, n_needs))
+            self.decay_matrix = np.empty((0, n_needs))
+            self.critical_matrix = np.empty((0, n_needs))
+
+        # Cada gestor pasa a ser una vista de su fila
+        for row, manager in enumerate(managers):
+            manager._levels = self.levels_matrix[row]
+            manager._decays = self.decay_matrix[row]
+            manager._critical = self.critical_matrix[row]
+
+    def tick(self, delta_time: float):
+        """Aplica el decaimiento de necesidades de todos los bots en una sola operación"""
+        levels = self.levels_matrix
+        levels -= self.decay_matrix * delta_time
+        np.maximum(levels, 0.0, out=levels)
+
+    def get_critical_mask(self) -> np.ndarray:
+        """Matriz booleana (N, 6) con las necesidades por debajo de su umbral crítico"""
+        return self.levels_matrix < self.critical_matrix
+
+    def get_bots_with_critical_needs(self) -> Dict[str, List[NeedType]]:
+        """Retorna, por nombre de bot, las necesidades que están en nivel crítico"""
+        mask = self.get_critical_mask()
+        return {
+            self.bots[row].name: [NEED_ORDER[i] for i in np.flatnonzero(mask[row]).tolist()]
+            for row in np.flatnonzero(mask.any(axis=1)).tolist()
+        }
@@ -1,22 +1,56 @@
-from typing import Dict
+from typing import Dict, Optional, Tuple
 from ..models.need_type import NeedType
 from ..models.emotional_state import EmotionalState
 from ..models.stimulus import Stimulus
+from ..entities.personality import Personality
+import numpy as np
+
+def _coefficient_vector(weights: Dict[str, float]) -> np.ndarray:
+    """Construye un vector de coeficientes alineado con Personality.CODE_INDEX"""
+    vector = np.zeros(len(Personality.FACTORS))
+    for code, weight in weights.items():
+        vector[Personality.CODE_INDEX[code]] = weight
+    return vector
 
 class StimulusProcessor:
     """Evalúa estímulos y determina respuestas basadas en necesidades y estado"""
     
+    # Influencia de cada factor de personalidad en los umbrales y percepciones
+    _THREAT_COEFFS = _coefficient_vector({
+        'C': -0.2,  # Estabilidad reduce el umbral
+        'H': -0.2,  # Atrevimiento reduce el umbral
+        'O': 0.1    # Aprensión aumenta el umbral
+    })
+    _STABILITY_COEFFS = _coefficient_vector({
+        'C': 0.2,   # Estabilidad aumenta el umbral
+        'Q4': -0.1  # Tensión reduce el umbral
+    })
+    _URGENCY_COEFFS = _coefficient_vector({
+        'F': -0.1,  # Animación reduce el umbral
+        'Q4': -0.1  # Tensión reduce el umbral
+    })
+    _PERCEIVED_THREAT_COEFFS = _coefficient_vector({
+        'O': 0.2,   # Aprensión aumenta la amenaza percibida
+        'C': -0.1   # Estabilidad reduce la amenaza percibida
+    })
+    _PERCEIVED_IMPACT_COEFFS = _coefficient_vector({
+        'F': 0.1,   # Animación aumenta el impacto percibido
+        'O': 0.1    # Aprensión aumenta el impacto percibido
+    })
+    
     def __init__(self, needs_manager, emotional_manager, personality):
         self.needs_manager = needs_manager
         self.emotional_manager = emotional_manager
         self.personality = personality
         self.stability_threshold = 0.5
+        
+        # Umbrales ajustados por personalidad, ligados a los valores con los que se calcularon
+        self._thresholds_key: Optional[bytes] = None
+        self._thresholds: Tuple[float, float, float] = (0.0, 0.0, 0.0)
 
     def evaluate_stimulus(self, stimulus: Stimulus) -> dict:
         # Modificar umbrales según personalidad
-        threat_threshold = self._adjust_threat_threshold()
-        stability_threshold = self._adjust_stability_threshold()
-        urgency_threshold = self._adjust_urgency_threshold()
+        threat_threshold, stability_threshold, urgency_threshold = self._get_thresholds()
 
         # 1. Evaluación de supervivencia
         survival_impact = stimulus.get_need_impact(NeedType.SURVIVAL)
@@ -85,52 +119,37 @@ class StimulusProcessor:
         """Retorna la prioridad numérica de una necesidad"""
         return need.value
     
+    def _get_thresholds(self) -> Tuple[float, float, float]:
+        """
+        Retorna los umbrales de amenaza, estabilidad y urgencia.
+        Solo se recalculan cuando cambian los valores de la personalidad.
+        """
+        key = self.personality.values.tobytes()
+        if key != self._thresholds_key:
+            self._thresholds = (
+                self._adjust_threat_threshold(),
+                self._adjust_stability_threshold(),
+                self._adjust_urgency_threshold()
+            )
+            self._thresholds_key = key
+        return self._thresholds
+
     def _adjust_threat_threshold(self) -> float:
         """Ajusta el umbral de amenaza según la personalidad"""
-        base_threshold = 0.7
-        # Factor C (Estabilidad) reduce el umbral
-        stability_mod = -0.2 * self.personality.factors['C'].value
-        # Factor H (Atrevimiento) reduce el umbral
-        boldness_mod = -0.2 * self.personality.factors['H'].value
-        # Factor O (Aprensión) aumenta el umbral
-        apprehension_mod = 0.1 * self.personality.factors['O'].value
-        
-        return max(0.3, min(0.9, base_threshold + stability_mod + boldness_mod + apprehension_mod))
+        return float(np.clip(0.7 + self._THREAT_COEFFS @ self.personality.values, 0.3, 0.9))
 
     def _adjust_stability_threshold(self) -> float:
         """Ajusta el umbral de estabilidad emocional según la personalidad"""
-        base_threshold = 0.5
-        # Factor C (Estabilidad) aumenta el umbral
-        stability_mod = 0.2 * self.personality.factors['C'].value
-        # Factor Q4 (Tensión) reduce el umbral
-        tension_mod = -0.1 * self.personality.factors['Q4'].value
-        
-        return max(0.2, min(0.8, base_threshold + stability_mod + tension_mod))
+        return float(np.clip(0.5 + self._STABILITY_COEFFS @ self.personality.values, 0.2, 0.8))
 
     def _adjust_urgency_threshold(self) -> float:
         """Ajusta el umbral de urgencia según la personalidad"""
-        base_threshold = 0.8
-        # Factor F (Animación) reduce el umbral
-        liveliness_mod = -0.1 * self.personality.factors['F'].value
-        # Factor Q4 (Tensión) reduce el umbral
-        tension_mod = -0.1 * self.personality.factors['Q4'].value
-        
-        return max(0.6, min(0.9, base_threshold + liveliness_mod + tension_mod))
+        return float(np.clip(0.8 + self._URGENCY_COEFFS @ self.personality.values, 0.6, 0.9))
 
     def _adjust_perceived_threat(self, threat_level: float) -> float:
         """Ajusta la percepción de amenaza según la personalidad"""
-        # Factor O (Aprensión) aumenta la amenaza percibida
-        apprehension_mod = 0.2 * self.personality.factors['O'].value
-        # Factor C (Estabilidad) reduce la amenaza percibida
-        stability_mod = -0.1 * self.personality.factors['C'].value
-        
-        return max(0.0, min(1.0, threat_level + apprehension_mod + stability_mod))
+        return float(np.clip(threat_level + self._PERCEIVED_THREAT_COEFFS @ self.personality.values, 0.0, 1.0))
 
     def _adjust_perceived_impact(self, impact: float) -> float:
         """Ajusta la percepción del impacto según la personalidad"""
-        # Factor F (Animación) aumenta el impacto percibido
-        liveliness_mod = 0.1 * self.personality.factors['F'].value
-        # Factor O (Aprensión) aumenta el impacto percibido
-        apprehension_mod = 0.1 * self.personality.factors['O'].value
-        
-        return max(0.0, min(1.0, impact + liveliness_mod + apprehension_mod))
\ No newline at end of file
+        return float(np.clip(impact + self._PERCEIVED_IMPACT_COEFFS @ self.personality.values, 0.0, 1.0))
\ No newline at end of file
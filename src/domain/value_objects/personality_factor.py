@@ -1,22 +1,44 @@
-from dataclasses import dataclass
+from bisect import bisect_left
+import numpy as np
 
-@dataclass
 class PersonalityFactor:
-    code: str
-    name: str
-    low_label: str
-    high_label: str
-    value: float = 0.0
+    """
+    Vista sobre un rasgo de personalidad. El valor no se guarda en el objeto
+    sino en una posición del array compartido de la personalidad a la que
+    pertenece, de modo que todos los rasgos quedan contiguos en memoria.
+    """
+    
+    __slots__ = ('code', 'name', 'low_label', 'high_label', '_storage', '_index', '_descriptors')
+    
+    # Límites entre descriptores; un valor igual a un límite cae en el tramo inferior
+    _DESCRIPTOR_BOUNDS = (-0.75, -0.25, 0.25, 0.75)
+    
+    def __init__(self, code: str, name: str, low_label: str, high_label: str,
+                 value: float = 0.0, storage: np.ndarray = None, index: int = 0):
+        self.code = code
+        self.name = name
+        self.low_label = low_label
+        self.high_label = high_label
+        self._descriptors = (f"Muy {low_label}", low_label, "Neutral",
+                             high_label, f"Muy {high_label}")
+        # Sin array compartido, el factor se guarda su propio valor
+        self._storage = storage if storage is not None else np.zeros(1)
+        self._index = index
+        self.value = value
+        
+    @property
+    def value(self) -> float:
+        return float(self._storage[self._index])
+        
+    @value.setter
+    def value(self, value: float):
+        self._storage[self._index] = value
+        
+    def __repr__(self) -> str:
+        return (f"PersonalityFactor(code={self.code!r}, name={self.name!r}, "
+                f"low_label={self.low_label!r}, high_label={self.high_label!r}, "
+                f"value={self.value!r})")
     
     def get_descriptor(self) -> str:
         """Retorna un descriptor basado en el valor actual"""
-        if self.value > 0.75:
-            return f"Muy {self.high_label}"
-        elif self.value > 0.25:
-            return self.high_label
-        elif self.value > -0.25:
-            return "Neutral"
-        elif self.value > -0.75:
-            return self.low_label
-        else:
-            return f"Muy {self.low_label}"
\ No newline at end of file
+        return self._descriptors[bisect_left(self._DESCRIPTOR_BOUNDS, self._storage[self._index])]
@@ -2,12 +2,19 @@ from pathlib import Path
 import json
 from typing import Any, Dict, Optional
 import logging
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 import os
 import yaml
 from threading import Lock
+from contextlib import contextmanager
+import functools
 import sys
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML sin libyaml
+    from yaml import SafeLoader
+
 @dataclass
 class UISettings:
     """Configuraciones de la interfaz de usuario"""
@@ -38,6 +45,7 @@ class PersonalitySettings:
     default_neutral_zone: float = 0.25
     show_numerical_values: bool = True
     show_trait_descriptions: bool = True
+    learning_rate: float = 0.1  # peso de cada experiencia al evolucionar una personalidad
 
 @dataclass
 class LogSettings:
@@ -52,10 +60,27 @@ class LogSettings:
 @dataclass
 class AppSettings:
     """Configuración principal de la aplicación"""
-    ui: UISettings = UISettings()
-    storage: StorageSettings = StorageSettings()
-    personality: PersonalitySettings = PersonalitySettings()
-    log: LogSettings = LogSettings()
+    ui: UISettings = field(default_factory=UISettings)
+    storage: StorageSettings = field(default_factory=StorageSettings)
+    personality: PersonalitySettings = field(default_factory=PersonalitySettings)
+    log: LogSettings = field(default_factory=LogSettings)
+
+# Configuración por defecto ya serializable, calculada una sola vez
+_DEFAULT_SETTINGS_DICT = asdict(AppSettings())
+
+@functools.lru_cache(maxsize=1)
+def _resolve_config_path() -> Path:
+    """
+    Resuelve la ruta del archivo de configuración y crea su directorio.
+    No cambia durante la ejecución, así que se calcula una sola vez.
+    """
+    if sys.platform == "win32":
+        config_dir = Path(os.getenv('APPDATA')) / "BotManager"
+    else:
+        config_dir = Path.home() / ".config" / "BotManager"
+        
+    config_dir.mkdir(parents=True, exist_ok=True)
+    return config_dir / "settings.json"
 
 class Settings:
     """
@@ -63,6 +88,8 @@ class Settings:
     Implementa el patrón Singleton para asegurar una única instancia.
     """
     _instance = None
+    # Instancia ya inicializada; get_settings() la devuelve sin pasar por __new__/__init__
+    _ready_instance: Optional['Settings'] = None
     _lock = Lock()
     
     def __new__(cls):
@@ -79,18 +106,17 @@ class Settings:
         self._initialized = True
         self._settings = AppSettings()
         self._config_file = self._get_config_path()
+        self._legacy_config_file = self._config_file.with_suffix('.yaml')
+        # Escrituras pendientes mientras hay un batch() activo
+        self._dirty = False
+        self._save_suspended = 0
         self._setup_logging()
         self.load()
+        Settings._ready_instance = self
         
     def _get_config_path(self) -> Path:
         """Determina la ruta del archivo de configuración según el sistema"""
-        if sys.platform == "win32":
-            config_dir = Path(os.getenv('APPDATA')) / "BotManager"
-        else:
-            config_dir = Path.home() / ".config" / "BotManager"
-            
-        config_dir.mkdir(parents=True, exist_ok=True)
-        return config_dir / "settings.yaml"
+        return _resolve_config_path()
     
     def _setup_logging(self):
         """Configura el sistema de logging"""
@@ -116,22 +142,30 @@ class Settings:
         """Carga las configuraciones desde el archivo"""
         try:
             if self._config_file.exists():
-                with self._config_file.open('r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f)
+                data = json.loads(self._config_file.read_bytes() or b'null')
+            elif self._legacy_config_file.exists():
+                # Configuración de versiones anteriores en YAML; se migra a JSON
+                with self._legacy_config_file.open('r', encoding='utf-8') as f:
+                    data = yaml.load(f, Loader=SafeLoader)
+            else:
+                return False
+                
+            if data:
+                # Cargar configuraciones por sección
+                if 'ui' in data:
+                    self._settings.ui = UISettings(**data['ui'])
+                if 'storage' in data:
+                    self._settings.storage = StorageSettings(**data['storage'])
+                if 'personality' in data:
+                    self._settings.personality = PersonalitySettings(**data['personality'])
+                if 'log' in data:
+                    self._settings.log = LogSettings(**data['log'])
                     
-                if data:
-                    # Cargar configuraciones por sección
-                    if 'ui' in data:
-                        self._settings.ui = UISettings(**data['ui'])
-                    if 'storage' in data:
-                        self._settings.storage = StorageSettings(**data['storage'])
-                    if 'personality' in data:
-                        self._settings.personality = PersonalitySettings(**data['personality'])
-                    if 'log' in data:
-                        self._settings.log = LogSettings(**data['log'])
-                        
-                self.logger.info("Configuraciones cargadas correctamente")
-                return True
+            if not self._config_file.exists():
+                self.save()
+                
+            self.logger.info("Configuraciones cargadas correctamente")
+            return True
         except Exception as e:
             self.logger.error(f"Error al cargar configuraciones: {str(e)}")
             self._create_default_config()
@@ -139,18 +173,23 @@ class Settings:
     
     def save(self) -> bool:
         """Guarda las configuraciones actuales en el archivo"""
+        # Convertir configuraciones a diccionario
+        settings_dict = {
+            'ui': asdict(self._settings.ui),
+            'storage': asdict(self._settings.storage),
+            'personality': asdict(self._settings.personality),
+            'log': asdict(self._settings.log)
+        }
+        return self._write_config(settings_dict)
+    
+    def _write_config(self, settings_dict: Dict[str, Any]) -> bool:
+        """Escribe un diccionario de configuraciones en el archivo"""
         try:
-            # Convertir configuraciones a diccionario
-            settings_dict = {
-                'ui': asdict(self._settings.ui),
-                'storage': asdict(self._settings.storage),
-                'personality': asdict(self._settings.personality),
-                'log': asdict(self._settings.log)
-            }
-            
-            # Guardar en formato YAML
-            with self._config_file.open('w', encoding='utf-8') as f:
-                yaml.dump(settings_dict, f, default_flow_style=False)
+            # Guardar en formato JSON
+            self._config_file.write_text(
+                json.dumps(settings_dict, indent=2, ensure_ascii=False),
+                encoding='utf-8'
+            )
                 
             self.logger.info("Configuraciones guardadas correctamente")
             return True
@@ -161,7 +200,7 @@ class Settings:
     def _create_default_config(self):
         """Crea un archivo de configuración con valores por defecto"""
         self._settings = AppSettings()
-        self.save()
+        self._write_config(_DEFAULT_SETTINGS_DICT)
         self.logger.info("Archivo de configuración por defecto creado")
     
     def get(self) -> AppSettings:
@@ -173,39 +212,66 @@ class Settings:
         for key, value in kwargs.items():
             if hasattr(self._settings.ui, key):
                 setattr(self._settings.ui, key, value)
-        self.save()
+        self._request_save()
         
     def update_storage(self, **kwargs):
         """Actualiza configuraciones de almacenamiento"""
         for key, value in kwargs.items():
             if hasattr(self._settings.storage, key):
                 setattr(self._settings.storage, key, value)
-        self.save()
+        self._request_save()
         
     def update_personality(self, **kwargs):
         """Actualiza configuraciones de personalidad"""
         for key, value in kwargs.items():
             if hasattr(self._settings.personality, key):
                 setattr(self._settings.personality, key, value)
-        self.save()
+        self._request_save()
         
     def update_log(self, **kwargs):
         """Actualiza configuraciones de logging"""
         for key, value in kwargs.items():
             if hasattr(self._settings.log, key):
                 setattr(self._settings.log, key, value)
-        self.save()
+        self._request_save()
         self._setup_logging()  # Reconfigurar logging con nuevos valores
     
+    def _request_save(self):
+        """Guarda los cambios, o los deja pendientes si hay un batch() activo"""
+        self._dirty = True
+        if self._save_suspended == 0:
+            self._dirty = False
+            self.save()
+    
+    @contextmanager
+    def batch(self):
+        """
+        Agrupa varias actualizaciones en una sola escritura del archivo.
+        
+        Ejemplo:
+            with settings.batch():
+                settings.update_ui(theme="dark")
+                settings.update_log(log_level="DEBUG")
+        """
+        self._save_suspended += 1
+        try:
+            yield self
+        finally:
+            self._save_suspended -= 1
+            if self._save_suspended == 0 and self._dirty:
+                self._dirty = False
+                self.save()
+    
     def reset_to_defaults(self):
         """Restablece todas las configuraciones a sus valores por defecto"""
         self._settings = AppSettings()
-        self.save()
+        self._dirty = False
+        self._write_config(_DEFAULT_SETTINGS_DICT)
         self.logger.info("Configuraciones restablecidas a valores por defecto")
 
 def get_settings() -> Settings:
     """Función de utilidad para obtener la instancia de Settings"""
-    return Settings()
+    return Settings._ready_instance or Settings()
 
 if __name__ == "__main__":
     # Código de prueba
@@ -0,0 +1,36 @@
+import atexit
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+
+_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+def get_queued_file_logger(name: str, file_name: str, level: int = logging.INFO) -> logging.Logger:
+    """
+    Obtiene un logger que escribe en un archivo a través de una cola.
+
+    Los registros se encolan y un hilo en segundo plano los escribe en el archivo,
+    de modo que quien registra no espera a la E/S del log. El logger solo se
+    configura la primera vez; las llamadas siguientes lo devuelven tal cual.
+
+    Args:
+        name: Nombre del logger
+        file_name: Archivo en el que se escriben los registros
+        level: Nivel mínimo de los registros
+
+    Returns:
+        logging.Logger: Logger configurado
+    """
+    logger = logging.getLogger(name)
+    if not logger.handlers:
+        handler = logging.FileHandler(file_name)
+        handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+
+        log_queue = SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+        listener = QueueListener(log_queue, handler)
+        listener.start()
+        # Vaciar la cola y cerrar el archivo al terminar el proceso
+        atexit.register(listener.stop)
+        logger.setLevel(level)
+    return logger
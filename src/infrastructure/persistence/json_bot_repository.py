@@ -1,34 +1,141 @@
 import json
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from ...domain.entities.bot import Bot
-from ...domain.repositories.bot_repository import BotRepository
+from ...domain.repositories.bot_repository import BotRepository, WriteResult
 from ...domain.entities.personality import Personality
+from ...domain.services.population_state import BotPopulationState
 import threading
-import logging
+from ..logging_setup import get_queued_file_logger
+import atexit
+import os
+import mmap
+import shutil
+import time
+from collections import deque
 from datetime import datetime
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional; sin él se usa json de la biblioteca estándar
+    orjson = None
+
+def _dumps(data) -> bytes:
+    """Serializa a JSON en UTF-8, con orjson si está disponible"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def _loads(data: bytes):
+    """Deserializa JSON desde bytes UTF-8, con orjson si está disponible"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _atomic_write(path: Path, payload: bytes):
+    """
+    Escribe un archivo de forma atómica: o queda el contenido anterior o el nuevo.
+    
+    Se escribe un temporal en el mismo directorio, se sincroniza y se renombra
+    sobre el destino; en POSIX se sincroniza también el directorio para que
+    el renombrado sobreviva a una caída.
+    """
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    
+    if os.name == 'posix':
+        dir_fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+def _read_json(path: Path):
+    """
+    Lee y deserializa un archivo JSON mapeándolo en memoria.
+    
+    Con orjson el contenido se analiza directamente desde el mapa, sin copiarlo
+    a un buffer intermedio; el sistema carga las páginas a medida que se leen.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap no admite archivos vacíos
+            return _loads(b'')
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if orjson is not None:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+            return json.loads(mm[:])
 
 class JsonBotRepository(BotRepository):
     """
     Implementación de BotRepository que almacena bots en un archivo JSON.
     Incluye características de:
-    - Auto-guardado
+    - Auto-guardado mediante un registro de cambios (WAL) de solo anexado
     - Backup automático
     - Manejo de concurrencia
+    - Escritura a disco en segundo plano
     - Validación de datos
     - Logging
     """
     
+    # Registros en el WAL a partir de los cuales se reescribe el archivo principal
+    _WAL_COMPACT_RECORDS = 500
+    
+    # Política de backups: como máximo uno cada _BACKUP_INTERVAL segundos salvo
+    # que se acumulen _BACKUP_EVERY_MUTATIONS modificaciones; se conservan _MAX_BACKUPS
+    _BACKUP_INTERVAL = 60.0
+    _BACKUP_EVERY_MUTATIONS = 50
+    _MAX_BACKUPS = 5
+    
+    # Espera del hilo escritor tras una modificación, para agrupar ráfagas
+    _WRITE_DEBOUNCE = 0.05
+    
     def __init__(self, file_path: str = "bots.json", backup_dir: str = "backups"):
         self.file_path = Path(file_path)
+        # Cada modificación se anexa como una línea JSON; el archivo principal
+        # solo se reescribe al compactar
+        self.wal_path = self.file_path.with_suffix('.wal')
+        self._wal_file = None
+        self._wal_records = 0
         self.backup_dir = Path(backup_dir)
         self.backup_dir.mkdir(exist_ok=True)
         
-        # Lock para manejo de concurrencia
-        self._lock = threading.Lock()
+        # Backups existentes, del más antiguo al más reciente; se lista el
+        # directorio una sola vez y después se mantiene en memoria. La fecha del
+        # nombre ordena cronológicamente sin hacer stat() de cada archivo
+        self._backups = deque(sorted(self.backup_dir.glob("bots_backup_*.json")))
+        self._last_backup_ts: Optional[float] = None
+        self._mutations_since_backup = 0
+        
+        # Lock para manejo de concurrencia. _lock protege solo el estado en
+        # memoria y se suelta antes de escribir a disco; _io_lock ordena las
+        # escrituras de archivos. Si se toman ambos, siempre _io_lock primero.
+        self._lock = threading.RLock()
+        self._io_lock = threading.RLock()
+        
+        # Líneas del WAL ya aplicadas en memoria y pendientes de escribir,
+        # en el mismo orden en que se aplicaron
+        self._pending_wal: List[bytes] = []
         
         # Caché en memoria
         self._bots: Dict[str, Bot] = {}
+        # Forma serializada de cada bot, en el mismo orden que self._bots; se
+        # actualiza solo la entrada modificada y se vuelca tal cual al compactar
+        self._serialized: Dict[str, dict] = {}
+        
+        # Matriz de valores de personalidad de todos los bots e índice ordenado
+        # por rasgo; ambos se descartan en cada escritura
+        self._factor_matrix_cache: Optional[Tuple[List[Bot], np.ndarray]] = None
+        self._trait_index_cache: Optional[Tuple[List[Bot], np.ndarray, np.ndarray]] = None
+        
+        # Necesidades de todos los bots agrupadas; se reconstruye al cambiar el conjunto de bots
+        self._population_state: Optional[BotPopulationState] = None
         
         # Configurar logging
         self._setup_logging()
@@ -36,130 +143,335 @@ class JsonBotRepository(BotRepository):
         # Cargar datos iniciales
         self._load_data()
         
+        # Hilo escritor: las modificaciones solo marcan _dirty y vuelven;
+        # el hilo agrupa lo pendiente y lo escribe a disco
+        self._dirty = threading.Event()
+        self._closed = False
+        self._writer = threading.Thread(
+            target=self._writer_loop,
+            name="JsonBotRepositoryWriter",
+            daemon=True
+        )
+        self._writer.start()
+        # Escribir lo pendiente al terminar el proceso
+        atexit.register(self.close)
+        
     def _setup_logging(self):
-        """Configura el sistema de logging"""
-        self.logger = logging.getLogger(__name__)
-        if not self.logger.handlers:
-            handler = logging.FileHandler('bot_repository.log')
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
-            self.logger.setLevel(logging.INFO)
+        """Configura el sistema de logging; las escrituras del repositorio no esperan a la E/S del log"""
+        self.logger = get_queued_file_logger(__name__, 'bot_repository.log')
             
     def _load_data(self):
-        """Carga los datos del archivo JSON"""
+        """Carga los datos del archivo JSON y reaplica los cambios pendientes del WAL"""
         try:
-            if self.file_path.exists():
-                with self._lock:
-                    data = json.loads(self.file_path.read_text(encoding='utf-8'))
-                    self._validate_data(data)
-                    self._bots = {
-                        name: Bot.from_dict(bot_data)
-                        for name, bot_data in data.items()
-                    }
-                self.logger.info(f"Datos cargados: {len(self._bots)} bots")
-            else:
-                self._bots = {}
-                self._save_data()  # Crear archivo inicial
+            with self._lock:
+                if self.file_path.exists():
+                    data = _read_json(self.file_path)
+                    self._bots, upgraded = self._build_bots(data)
+                    self._serialized = data
+                    created = False
+                else:
+                    self._bots = {}
+                    self._serialized = {}
+                    created = True
+                    upgraded = 0
+                    
+                replayed = self._replay_wal()
+                
+            if created or upgraded or self.wal_path.exists():
+                # Crear el archivo inicial, reescribirlo en el formato actual o
+                # incorporar el WAL reaplicado; también se descarta así una línea
+                # incompleta antes de anexar otras
+                self._compact()
+                
+            if created:
                 self.logger.info("Archivo de datos creado")
+            if upgraded:
+                self.logger.info("Bots migrados al formato actual: %s", upgraded)
+            if replayed:
+                self.logger.info("Cambios recuperados del WAL: %s", replayed)
+            self.logger.info("Datos cargados: %s bots", len(self._bots))
         except Exception as e:
-            self.logger.error(f"Error al cargar datos: {str(e)}")
+            self.logger.error("Error al cargar datos: %s", e)
             self._handle_data_corruption()
             
-    def _save_data(self):
-        """Guarda los datos en el archivo JSON"""
-        try:
+    def _replay_wal(self) -> int:
+        """
+        Aplica sobre self._bots y self._serialized los cambios registrados en el WAL.
+        
+        Una última línea incompleta (escritura interrumpida) se descarta.
+        _compact() garantiza que el WAL contiene todo lo incluido en el archivo
+        principal desde la compactación anterior, así que reaplicar un WAL cuyo
+        vaciado no llegó a disco no altera el resultado.
+        
+        Returns:
+            int: Número de cambios aplicados
+        """
+        if not self.wal_path.exists():
+            return 0
+            
+        applied = 0
+        for line in self.wal_path.read_bytes().splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = _loads(line)
+            except ValueError:
+                self.logger.warning("Registro incompleto al final del WAL descartado")
+                break
+                
+            op = record.get('op')
+            if op == 'put':
+                self._validate_entry(record['name'], record['data'])
+                bot = Bot.from_dict(record['data'])
+                self._bots[record['name']] = bot
+                if record['data'].get('version') != Bot.FORMAT_VERSION:
+                    record['data'] = bot.to_dict()
+            elif op == 'del':
+                self._bots.pop(record['name'], None)
+            elif op == 'clear':
+                self._bots.clear()
+            else:
+                raise ValueError(f"Operación desconocida en el WAL: {op}")
+            self._apply_serialized(record)
+            applied += 1
+        return applied
+        
+    def _invalidate_caches(self):
+        """Descarta los datos derivados de self._bots; se llama en cada modificación"""
+        self._factor_matrix_cache = None
+        self._trait_index_cache = None
+        self._population_state = None
+        
+    def _stage_mutation(self, *records: dict):
+        """
+        Registra modificaciones recién aplicadas en self._bots.
+        
+        Debe llamarse con _lock tomado, justo después de modificar self._bots,
+        para que el orden del WAL coincida con el de las modificaciones.
+        Solo se serializan los registros recibidos.
+        """
+        self._invalidate_caches()
+        self._version += 1
+        self._mutations_since_backup += 1
+        for record in records:
+            self._apply_serialized(record)
+            self._pending_wal.append(_dumps(record) + b'\n')
+            
+    def _apply_serialized(self, record: dict):
+        """Aplica un registro del WAL sobre self._serialized"""
+        op = record['op']
+        if op == 'put':
+            self._serialized[record['name']] = record['data']
+        elif op == 'del':
+            self._serialized.pop(record['name'], None)
+        else:
+            self._serialized.clear()
+        
+    def _flush_wal(self):
+        """
+        Anexa al WAL las modificaciones pendientes y las sincroniza a disco.
+        
+        La llama el hilo escritor o flush(), sin _lock tomado: las lecturas y
+        las modificaciones en memoria no esperan al disco. Al volver, todo lo
+        que estaba pendiente al llamarla ya está en disco.
+        """
+        with self._io_lock:
             with self._lock:
-                data = {
-                    name: bot.to_dict()
-                    for name, bot in self._bots.items()
-                }
-                self.file_path.write_text(
-                    json.dumps(data, indent=2, ensure_ascii=False),
-                    encoding='utf-8'
-                )
-            self.logger.info(f"Datos guardados: {len(self._bots)} bots")
-        except Exception as e:
-            self.logger.error(f"Error al guardar datos: {str(e)}")
-            raise
+                pending, self._pending_wal = self._pending_wal, []
+            self._append_wal(pending)
+            if self._wal_records >= self._WAL_COMPACT_RECORDS:
+                self._compact()
+                
+    def _append_wal(self, pending: List[bytes]):
+        """Anexa líneas al WAL y las sincroniza a disco (con _io_lock tomado)"""
+        if not pending:
+            return
             
-    def _create_backup(self):
-        """Crea una copia de seguridad del archivo de datos"""
-        try:
-            if self.file_path.exists():
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                backup_path = self.backup_dir / f"bots_backup_{timestamp}.json"
-                with self._lock:
-                    data = json.loads(self.file_path.read_text(encoding='utf-8'))
-                    backup_path.write_text(
-                        json.dumps(data, indent=2, ensure_ascii=False),
-                        encoding='utf-8'
-                    )
-                self.logger.info(f"Backup creado: {backup_path}")
+        if self._wal_file is None:
+            self._wal_file = self.wal_path.open('ab')
+        self._wal_file.write(b''.join(pending))
+        self._wal_file.flush()
+        os.fsync(self._wal_file.fileno())
+        self._wal_records += len(pending)
+        
+    def _truncate_wal(self):
+        """Vacía el WAL y sincroniza el vaciado a disco (con _io_lock tomado)"""
+        if self._wal_file is not None:
+            self._wal_file.truncate(0)
+            os.fsync(self._wal_file.fileno())
+        elif self.wal_path.exists():
+            self.wal_path.unlink()
+        self._wal_records = 0
+        
+    def _compact(self):
+        """
+        Reescribe el archivo principal con el estado actual y vacía el WAL.
+        
+        Lo pendiente se anexa al WAL antes de reemplazar el archivo principal:
+        si el proceso cae antes de vaciar el WAL, este contiene todas las
+        modificaciones incluidas en el archivo y reaplicarlas no lo altera.
+        """
+        with self._io_lock:
+            with self._lock:
+                # Copia superficial: las entradas se reemplazan, nunca se modifican
+                data = dict(self._serialized)
+                pending, self._pending_wal = self._pending_wal, []
+            self._append_wal(pending)
+            self._save_data(data)
+            self._truncate_wal()
+            
+    def _writer_loop(self):
+        """Bucle del hilo escritor: espera modificaciones y las escribe agrupadas"""
+        while not self._closed:
+            self._dirty.wait()
+            if self._closed:
+                return
+            time.sleep(self._WRITE_DEBOUNCE)
+            self._dirty.clear()
+            try:
+                self._flush_wal()
+                self._create_backup()
+            except Exception as e:
+                self.logger.error("Error en el hilo de escritura: %s", e)
+                
+    def flush(self):
+        """Escribe a disco las modificaciones pendientes sin esperar al hilo escritor"""
+        self._flush_wal()
+        
+    def close(self):
+        """Detiene el hilo escritor, escribe lo pendiente y cierra el archivo del WAL"""
+        self._closed = True
+        self._dirty.set()
+        if self._writer.is_alive() and self._writer is not threading.current_thread():
+            self._writer.join()
+        self.flush()
+        with self._io_lock:
+            if self._wal_file is not None:
+                self._wal_file.close()
+                self._wal_file = None
                 
-                # Mantener solo los últimos 5 backups
-                self._cleanup_old_backups()
+    def _save_data(self, data: Dict[str, dict]):
+        """Guarda los datos en el archivo JSON (con _io_lock tomado)"""
+        try:
+            # Sin sangría: el archivo principal se reescribe en cada compactación
+            _atomic_write(self.file_path, _dumps(data))
+            self.logger.debug("Datos guardados: %s bots", len(data))
         except Exception as e:
-            self.logger.error(f"Error al crear backup: {str(e)}")
+            self.logger.error("Error al guardar datos: %s", e)
+            raise
             
-    def _cleanup_old_backups(self):
-        """Elimina backups antiguos manteniendo solo los más recientes"""
+    def _create_backup(self, force: bool = False) -> bool:
+        """
+        Crea una copia de seguridad del archivo de datos.
+        
+        La llama el hilo escritor tras cada escritura, pero solo copia si ha
+        pasado _BACKUP_INTERVAL desde el último backup, si se han acumulado
+        _BACKUP_EVERY_MUTATIONS modificaciones o si force es True.
+        
+        Returns:
+            bool: True si se creó el backup
+        """
         try:
-            backups = sorted(
-                self.backup_dir.glob("bots_backup_*.json"),
-                key=lambda x: x.stat().st_mtime,
-                reverse=True
-            )
-            
-            for backup in backups[5:]:  # Mantener solo los últimos 5
-                backup.unlink()
-                self.logger.info(f"Backup antiguo eliminado: {backup}")
+            with self._lock:
+                now = time.monotonic()
+                due = (
+                    force
+                    or self._last_backup_ts is None
+                    or now - self._last_backup_ts >= self._BACKUP_INTERVAL
+                    or self._mutations_since_backup >= self._BACKUP_EVERY_MUTATIONS
+                )
+                if not due or not self.file_path.exists():
+                    return False
+                    
+                self._last_backup_ts = now
+                self._mutations_since_backup = 0
+                
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            backup_path = self.backup_dir / f"bots_backup_{timestamp}.json"
+            with self._io_lock:
+                # Incorporar el WAL para que el archivo principal esté al día
+                self._flush_wal()
+                if self._wal_records:
+                    self._compact()
+                    
+                # Copia byte a byte (copy_file_range/sendfile en el kernel). No se usa
+                # un enlace duro: una edición en el sitio del archivo principal
+                # corrompería también el backup
+                shutil.copyfile(self.file_path, backup_path)
+                    
+                # Dos backups en el mismo segundo comparten archivo
+                if backup_path in self._backups:
+                    self._backups.remove(backup_path)
+                self._backups.append(backup_path)
+                
+                # Mantener solo los últimos backups
+                while len(self._backups) > self._MAX_BACKUPS:
+                    old_backup = self._backups.popleft()
+                    old_backup.unlink(missing_ok=True)
+                    self.logger.info("Backup antiguo eliminado: %s", old_backup)
+            self.logger.info("Backup creado: %s", backup_path)
+            return True
         except Exception as e:
-            self.logger.error(f"Error al limpiar backups: {str(e)}")
+            self.logger.error("Error al crear backup: %s", e)
+            return False
             
-    def _validate_data(self, data: dict):
-        """Valida la estructura de los datos cargados"""
+    def _build_bots(self, data: dict) -> Tuple[Dict[str, Bot], int]:
+        """
+        Valida los datos cargados y crea los bots en una sola pasada.
+        
+        Las entradas guardadas con un formato anterior se reemplazan en data
+        por su forma actual.
+        
+        Returns:
+            Tuple[Dict[str, Bot], int]: Bots por nombre y número de entradas migradas
+        """
         if not isinstance(data, dict):
             raise ValueError("Los datos deben ser un diccionario")
             
+        bots = {}
+        upgraded = 0
         for name, bot_data in data.items():
-            if not isinstance(name, str):
-                raise ValueError(f"Nombre de bot inválido: {name}")
-            if not isinstance(bot_data, dict):
-                raise ValueError(f"Datos de bot inválidos para {name}")
-            if 'personality' not in bot_data:
-                raise ValueError(f"Faltan datos de personalidad para {name}")
+            self._validate_entry(name, bot_data)
+            bot = bots[name] = Bot.from_dict(bot_data)
+            if bot_data.get('version') != Bot.FORMAT_VERSION:
+                data[name] = bot.to_dict()
+                upgraded += 1
+        return bots, upgraded
+        
+    def _validate_entry(self, name: str, bot_data: dict):
+        """Valida la estructura de los datos de un bot"""
+        if not isinstance(name, str):
+            raise ValueError(f"Nombre de bot inválido: {name}")
+        if not isinstance(bot_data, dict):
+            raise ValueError(f"Datos de bot inválidos para {name}")
+        if 'personality' not in bot_data:
+            raise ValueError(f"Faltan datos de personalidad para {name}")
                 
     def _handle_data_corruption(self):
         """Maneja casos de corrupción de datos"""
         self.logger.warning("Intentando recuperar de backup...")
         
-        # Buscar el backup más reciente
-        backups = sorted(
-            self.backup_dir.glob("bots_backup_*.json"),
-            key=lambda x: x.stat().st_mtime,
-            reverse=True
-        )
-        
-        if backups:
+        if self._backups:
             try:
                 # Intentar cargar el backup más reciente
-                data = json.loads(backups[0].read_text(encoding='utf-8'))
-                self._validate_data(data)
-                self._bots = {
-                    name: Bot.from_dict(bot_data)
-                    for name, bot_data in data.items()
-                }
-                self._save_data()  # Restaurar archivo principal
-                self.logger.info(f"Recuperación exitosa desde {backups[0]}")
+                latest_backup = self._backups[-1]
+                data = _read_json(latest_backup)
+                self._bots, _ = self._build_bots(data)
+                self._serialized = data
+                with self._io_lock:
+                    # El WAL no se reaplica sobre el backup: se descarta antes de
+                    # reescribir el archivo principal
+                    self._truncate_wal()
+                    self._save_data(data)
+                self.logger.info("Recuperación exitosa desde %s", latest_backup)
             except Exception as e:
-                self.logger.error(f"Error en recuperación: {str(e)}")
+                self.logger.error("Error en recuperación: %s", e)
                 self._bots = {}  # Iniciar con datos limpios
+                self._serialized = {}
         else:
             self.logger.warning("No hay backups disponibles")
             self._bots = {}
+            self._serialized = {}
             
     # Implementación de la interfaz BotRepository
     
@@ -168,27 +480,145 @@ class JsonBotRepository(BotRepository):
         try:
             with self._lock:
                 self._bots[bot.name] = bot
-                self._save_data()
-                self._create_backup()
-            self.logger.info(f"Bot guardado: {bot.name}")
+                self._stage_mutation(self._put_record(bot))
+            self._dirty.set()
+            self.logger.debug("Bot guardado: %s", bot.name)
             return True
         except Exception as e:
-            self.logger.error(f"Error al guardar bot {bot.name}: {str(e)}")
+            self.logger.error("Error al guardar bot %s: %s", bot.name, e)
             return False
             
+    def save_many(self, bots: List[Bot]) -> int:
+        """Guarda varios bots con una única escritura del archivo"""
+        try:
+            with self._lock:
+                for bot in bots:
+                    self._bots[bot.name] = bot
+                self._stage_mutation(*(self._put_record(bot) for bot in bots))
+            self._dirty.set()
+            self.logger.debug("Bots guardados en lote: %s", len(bots))
+            return len(bots)
+        except Exception as e:
+            self.logger.error("Error al guardar lote de bots: %s", e)
+            return 0
+            
     def delete(self, name: str) -> bool:
         """Elimina un bot del repositorio"""
+        return self.try_delete(name) is WriteResult.SUCCESS
+        
+    def delete_many(self, names: List[str]) -> int:
+        """Elimina varios bots bajo un único lock y con una única escritura del WAL"""
         try:
             with self._lock:
-                if name in self._bots:
+                existing = [name for name in dict.fromkeys(names) if name in self._bots]
+                if not existing:
+                    return 0
+                for name in existing:
                     del self._bots[name]
-                    self._save_data()
-                    self._create_backup()
-                    self.logger.info(f"Bot eliminado: {name}")
-                    return True
-                return False
+                self._stage_mutation(*({'op': 'del', 'name': name} for name in existing))
+            self._dirty.set()
+            self.logger.debug("Bots eliminados en lote: %s", len(existing))
+            return len(existing)
         except Exception as e:
-            self.logger.error(f"Error al eliminar bot {name}: {str(e)}")
+            self.logger.error("Error al eliminar lote de bots: %s", e)
+            return 0
+        
+    def try_create(self, bot: Bot) -> WriteResult:
+        """Guarda un bot si no existe, comprobando y escribiendo bajo el mismo lock"""
+        try:
+            with self._lock:
+                if bot.name in self._bots:
+                    return WriteResult.ALREADY_EXISTS
+                self._bots[bot.name] = bot
+                self._stage_mutation(self._put_record(bot))
+            self._dirty.set()
+            self.logger.debug("Bot creado: %s", bot.name)
+            return WriteResult.SUCCESS
+        except Exception as e:
+            self.logger.error("Error al crear bot %s: %s", bot.name, e)
+            return WriteResult.ERROR
+            
+    def try_update(self, bot: Bot) -> WriteResult:
+        """Actualiza un bot si existe, comprobando y escribiendo bajo el mismo lock"""
+        try:
+            with self._lock:
+                if bot.name not in self._bots:
+                    return WriteResult.NOT_FOUND
+                self._bots[bot.name] = bot
+                self._stage_mutation(self._put_record(bot))
+            self._dirty.set()
+            self.logger.debug("Bot actualizado: %s", bot.name)
+            return WriteResult.SUCCESS
+        except Exception as e:
+            self.logger.error("Error al actualizar bot %s: %s", bot.name, e)
+            return WriteResult.ERROR
+            
+    def try_delete(self, name: str) -> WriteResult:
+        """Elimina un bot si existe, comprobando y escribiendo bajo el mismo lock"""
+        try:
+            with self._lock:
+                if name not in self._bots:
+                    return WriteResult.NOT_FOUND
+                del self._bots[name]
+                self._stage_mutation({'op': 'del', 'name': name})
+            self._dirty.set()
+            self.logger.debug("Bot eliminado: %s", name)
+            return WriteResult.SUCCESS
+        except Exception as e:
+            self.logger.error("Error al eliminar bot %s: %s", name, e)
+            return WriteResult.ERROR
+            
+    @staticmethod
+    def _put_record(bot: Bot) -> dict:
+        """Registro del WAL que guarda o reemplaza un bot"""
+        return {'op': 'put', 'name': bot.name, 'data': bot.to_dict()}
+            
+    def _get_factor_matrix(self) -> Tuple[List[Bot], np.ndarray]:
+        """Obtiene los bots y su matriz de valores, reutilizándola hasta la próxima escritura"""
+        with self._lock:
+            if self._factor_matrix_cache is None:
+                self._factor_matrix_cache = super()._get_factor_matrix()
+            return self._factor_matrix_cache
+            
+    def _get_trait_index(self) -> Tuple[List[Bot], np.ndarray, np.ndarray]:
+        """Obtiene el índice ordenado por rasgo, reutilizándolo hasta la próxima escritura"""
+        with self._lock:
+            if self._trait_index_cache is None:
+                self._trait_index_cache = super()._get_trait_index()
+            return self._trait_index_cache
+            
+    def _get_population_state(self) -> BotPopulationState:
+        """Obtiene el estado de necesidades agrupado, reutilizándolo hasta la próxima escritura"""
+        with self._lock:
+            if self._population_state is None:
+                self._population_state = super()._get_population_state()
+            return self._population_state
+            
+    def create_backup(self) -> bool:
+        """Crea una copia de seguridad inmediata, sin esperar a la política de backups"""
+        return self._create_backup(force=True)
+        
+    def restore_from_backup(self, backup_date: datetime) -> bool:
+        """Restaura el repositorio desde el backup creado en la fecha indicada (al segundo)"""
+        timestamp = backup_date.strftime("%Y%m%d_%H%M%S")
+        backup_path = self.backup_dir / f"bots_backup_{timestamp}.json"
+        try:
+            data = _read_json(backup_path)
+            bots, _ = self._build_bots(data)
+            with self._lock:
+                self._bots = bots
+                # Se registra como cualquier modificación para que el WAL
+                # reproduzca la restauración si se cae antes de compactar
+                self._stage_mutation(
+                    {'op': 'clear'},
+                    *({'op': 'put', 'name': name, 'data': bot_data}
+                      for name, bot_data in data.items())
+                )
+            self._compact()
+            self.logger.info("Repositorio restaurado desde %s", backup_path)
+            return True
+        except Exception as e:
+            self.logger.error("Error al restaurar desde backup: %s", e)
             return False
             
     def get(self, name: str) -> Optional[Bot]:
@@ -205,30 +635,20 @@ class JsonBotRepository(BotRepository):
         
     def update(self, bot: Bot) -> bool:
         """Actualiza un bot existente"""
-        try:
-            with self._lock:
-                if bot.name in self._bots:
-                    self._bots[bot.name] = bot
-                    self._save_data()
-                    self._create_backup()
-                    self.logger.info(f"Bot actualizado: {bot.name}")
-                    return True
-                return False
-        except Exception as e:
-            self.logger.error(f"Error al actualizar bot {bot.name}: {str(e)}")
-            return False
+        return self.try_update(bot) is WriteResult.SUCCESS
             
     def clear(self) -> bool:
         """Elimina todos los bots"""
         try:
+            self._create_backup(force=True)  # Crear backup antes de limpiar
             with self._lock:
-                self._create_backup()  # Crear backup antes de limpiar
                 self._bots.clear()
-                self._save_data()
+                self._stage_mutation({'op': 'clear'})
+            self._dirty.set()
             self.logger.info("Repositorio limpiado")
             return True
         except Exception as e:
-            self.logger.error(f"Error al limpiar repositorio: {str(e)}")
+            self.logger.error("Error al limpiar repositorio: %s", e)
             return False
 
 if __name__ == "__main__":
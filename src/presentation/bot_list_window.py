@@ -3,10 +3,10 @@ from tkinter import ttk, messagebox
 from typing import List, Optional, Dict
 from ..domain.entities.bot import Bot
 from ..domain.entities.personality import Personality
+from ..domain.repositories.bot_repository import BotRepository, WriteResult
+from ..infrastructure.persistence.json_bot_repository import JsonBotRepository
 from .dialogs.bot_creation_dialog import BotCreationDialog
 from .dialogs.personality_editor_dialog import PersonalityEditorDialog
-import json
-from pathlib import Path
 
 class BotListWindow(ttk.Frame):
     """
@@ -14,12 +14,33 @@ class BotListWindow(ttk.Frame):
     Incluye funcionalidades de ordenamiento, filtrado y visualización detallada.
     """
     
-    def __init__(self, master):
+    # Espera tras la última pulsación antes de aplicar el filtro de búsqueda
+    _FILTER_DELAY_MS = 80
+    
+    def __init__(self, master, repository: Optional[BotRepository] = None):
         super().__init__(master)
         self.master = master
+        # Toda la persistencia pasa por el repositorio; self.bots es la vista
+        # de la ventana sobre sus datos en memoria
+        self.repository = repository if repository is not None else JsonBotRepository()
         self.bots: Dict[str, Bot] = {}
         self.selected_bot: Optional[Bot] = None
         
+        # Filas del Treeview por nombre de bot (el id de cada fila es el propio
+        # nombre); el filtro solo reordena/oculta filas existentes en lugar de recrearlas
+        self._item_ids: Dict[str, str] = {}
+        # Nombres en minúsculas para la búsqueda, calculados al reconstruir la lista
+        self._lower_names: Dict[str, str] = {}
+        # Rasgo dominante por nombre de bot; se conserva entre refrescos y se
+        # descarta al editar o eliminar el bot
+        self._dominant_traits: Dict[str, str] = {}
+        self._filter_job: Optional[str] = None
+        
+        # Columna de ordenación activa y, por columna, los nombres ya ordenados;
+        # se descartan al reconstruir la lista
+        self._sort_column: Optional[str] = None
+        self._sorted_names: Dict[str, List[str]] = {}
+        
         self.setup_ui()
         self.load_bots()
         
@@ -94,7 +115,7 @@ class BotListWindow(ttk.Frame):
             left_frame,
             columns=columns,
             show='headings',
-            selectmode='browse'
+            selectmode='extended'
         )
         
         # Configurar columnas
@@ -181,36 +202,27 @@ class BotListWindow(ttk.Frame):
         self.status_bar.pack(fill=tk.X, side=tk.BOTTOM, padx=5, pady=2)
         
     def load_bots(self):
-        """Carga los bots desde el archivo de persistencia"""
+        """Carga los bots desde el repositorio"""
         try:
-            if Path('bots.json').exists():
-                data = json.loads(Path('bots.json').read_text())
-                self.bots = {name: Bot.from_dict(bot_data) 
-                            for name, bot_data in data.items()}
-                self.refresh_bot_list()
-                self.update_status(f"Bots cargados: {len(self.bots)}")
+            self.bots = {bot.name: bot for bot in self.repository.get_all()}
+            self._dominant_traits.clear()
+            self.refresh_bot_list()
+            self.update_status(f"Bots cargados: {len(self.bots)}")
         except Exception as e:
             self.update_status(f"Error al cargar bots: {str(e)}")
             
-    def save_bots(self):
-        """Guarda los bots en el archivo de persistencia"""
-        try:
-            data = {name: bot.to_dict() for name, bot in self.bots.items()}
-            Path('bots.json').write_text(json.dumps(data, indent=2))
-            self.update_status("Bots guardados correctamente")
-        except Exception as e:
-            self.update_status(f"Error al guardar bots: {str(e)}")
-            
     def create_bot(self):
         """Abre el diálogo de creación de bot"""
         def on_bot_created(bot: Bot):
-            if bot.name not in self.bots:
+            result = self.repository.try_create(bot)
+            if result is WriteResult.SUCCESS:
                 self.bots[bot.name] = bot
-                self.save_bots()
                 self.refresh_bot_list()
                 self.update_status(f"Bot '{bot.name}' creado")
-            else:
+            elif result is WriteResult.ALREADY_EXISTS:
                 self.update_status(f"Ya existe un bot llamado '{bot.name}'")
+            else:
+                self.update_status(f"Error al guardar el bot '{bot.name}'")
                 
         BotCreationDialog(self, on_bot_created)
         
@@ -219,28 +231,46 @@ class BotListWindow(ttk.Frame):
         if not self.selected_bot:
             return
             
-        bot = self.bots[self.selected_bot]
+        bot = self.selected_bot
         def on_save():
-            self.save_bots()
+            self._dominant_traits.pop(bot.name, None)
             self.refresh_bot_list()
-            self.update_status(f"Bot '{bot.name}' actualizado")
+            if self.repository.update(bot):
+                self.update_status(f"Bot '{bot.name}' actualizado")
+            else:
+                self.update_status(f"Error al guardar el bot '{bot.name}'")
             
         PersonalityEditorDialog(self, bot.personality, on_save)
         
     def delete_bot(self):
-        """Elimina el bot seleccionado"""
-        if not self.selected_bot:
+        """Elimina los bots seleccionados, con una sola confirmación"""
+        # Los ids de las filas son los nombres de los bots
+        names = [name for name in self.bot_tree.selection() if name in self.bots]
+        if not names:
             return
             
-        if tk.messagebox.askyesno(
-            "Confirmar eliminación",
-            f"¿Estás seguro de eliminar el bot '{self.selected_bot}'?"
-        ):
-            del self.bots[self.selected_bot]
-            self.save_bots()
-            self.selected_bot = None
-            self.refresh_bot_list()
-            self.update_status(f"Bot eliminado")
+        if len(names) == 1:
+            message = f"¿Estás seguro de eliminar el bot '{names[0]}'?"
+        else:
+            message = f"¿Estás seguro de eliminar {len(names)} bots?"
+        if not tk.messagebox.askyesno("Confirmar eliminación", message):
+            return
+            
+        deleted = self.repository.delete_many(names)
+        # Quitar de la vista solo los que ya no están en el repositorio
+        for name in names:
+            if not self.repository.exists(name):
+                del self.bots[name]
+                self._dominant_traits.pop(name, None)
+        self.selected_bot = None
+        self.refresh_bot_list()
+        
+        if deleted < len(names):
+            self.update_status(f"Error al eliminar {len(names) - deleted} de {len(names)} bots")
+        elif deleted == 1:
+            self.update_status("Bot eliminado")
+        else:
+            self.update_status(f"{deleted} bots eliminados")
 
     def simulate_bot(self):
         """Abre la ventana de simulación para el bot seleccionado"""
@@ -255,33 +285,41 @@ class BotListWindow(ttk.Frame):
             
     def refresh_bot_list(self):
         """Actualiza la lista de bots"""
-        self.bot_tree.delete(*self.bot_tree.get_children())
-        
+        # Incluye las filas ocultas por el filtro, que no son hijas visibles
+        self.bot_tree.delete(*self._item_ids.values())
+        self._item_ids = {}
+        self._lower_names = {}
+        self._sorted_names.clear()
+        
+        # Llamada directa a Tcl por fila, sin el formateo de opciones de
+        # Treeview.insert, que domina el tiempo con muchos bots
+        tk_call = self.bot_tree.tk.call
+        tree_path = self.bot_tree._w
         for name, bot in self.bots.items():
-            # Encontrar rasgo dominante
-            dominant_trait = self.get_dominant_trait(bot.personality)
+            # Encontrar rasgo dominante (solo si no está ya calculado)
+            dominant_trait = self._dominant_traits.get(name)
+            if dominant_trait is None:
+                dominant_trait = self.get_dominant_trait(bot.personality)
+                self._dominant_traits[name] = dominant_trait
             
-            self.bot_tree.insert(
-                '',
-                'end',
-                values=(name, dominant_trait)
-            )
+            tk_call(tree_path, 'insert', '', 'end', '-id', name, '-values', (name, dominant_trait))
+            self._item_ids[name] = name
+            self._lower_names[name] = name.lower()
+            
+        # Mantener la ordenación y el filtro de búsqueda activos
+        if self._sort_column is not None or self.search_var.get():
+            self._show_rows()
             
     def get_dominant_trait(self, personality: Personality) -> str:
         """Obtiene el rasgo dominante de una personalidad"""
-        max_value = 0
-        dominant_trait = "Neutral"
-        
-        for code, factor in personality.factors.items():
-            abs_value = abs(factor.value)
-            if abs_value > max_value:
-                max_value = abs_value
-                if factor.value > 0:
-                    dominant_trait = factor.high_label
-                else:
-                    dominant_trait = factor.low_label
-                    
-        return dominant_trait
+        # Ante empates gana el primer factor, como en un recorrido con '>'
+        factor = max(personality.factors.values(), key=lambda f: abs(f.value))
+        value = factor.value
+        if value > 0:
+            return factor.high_label
+        if value < 0:
+            return factor.low_label
+        return "Neutral"
         
     def on_bot_selected(self, event):
         """Maneja la selección de un bot"""
@@ -294,20 +332,20 @@ class BotListWindow(ttk.Frame):
             self.clear_personality_view()
             return
             
-        # Obtener bot seleccionado
-        item = self.bot_tree.item(selection[0])
-        selected_name = item['values'][0]
-        for bot_name, bot_object in self.bots.items():
-            if bot_name == selected_name:
-                self.selected_bot = bot_object
-        
-        # Habilitar botones
-        self.edit_button.configure(state=tk.NORMAL)
+        # Obtener bot seleccionado: el id de la fila es el nombre del bot
+        selected_name = selection[0]
+        self.selected_bot = self.bots.get(selected_name)
+        if self.selected_bot is None:
+            return
+        
+        # Habilitar botones; editar y simular actúan sobre un único bot
+        single_state = tk.NORMAL if len(selection) == 1 else tk.DISABLED
+        self.edit_button.configure(state=single_state)
         self.delete_button.configure(state=tk.NORMAL)
-        self.simulate_button.configure(state=tk.NORMAL)
+        self.simulate_button.configure(state=single_state)
         
         # Actualizar vista de personalidad
-        self.update_personality_view(self.bots[selected_name].personality)
+        self.update_personality_view(self.selected_bot.personality)
         
     def update_personality_view(self, personality: Personality):
         """Actualiza la vista de personalidad con los valores del bot seleccionado"""
@@ -341,23 +379,47 @@ class BotListWindow(ttk.Frame):
             
     def sort_bots(self, column):
         """Ordena la lista de bots por la columna especificada"""
-        items = [(self.bot_tree.set(child, column), child) 
-                for child in self.bot_tree.get_children('')]
-        
-        items.sort()  # Ordenar por el valor de la columna
+        self._sort_column = column
+        self._show_rows()
+        
+    def _get_sorted_names(self, column: str) -> List[str]:
+        """Nombres de los bots de la lista ordenados por la columna indicada"""
+        names = self._sorted_names.get(column)
+        if names is None:
+            # Los valores salen de los datos ya calculados, no de cada fila del Treeview
+            if column == 'dominant_trait':
+                names = sorted(self._item_ids, key=lambda name: (self._dominant_traits[name], name))
+            else:
+                names = sorted(self._item_ids)
+            self._sorted_names[column] = names
+        return names
         
-        for idx, (_, child) in enumerate(items):
-            self.bot_tree.move(child, '', idx)
+    def _show_rows(self):
+        """Muestra, en el orden activo, las filas que pasan el filtro de búsqueda"""
+        search_text = self.search_var.get().lower()
+        if self._sort_column is None:
+            names = self._item_ids
+        else:
+            names = self._get_sorted_names(self._sort_column)
+            
+        # Una sola llamada a Tk: las filas que no se pasan quedan desvinculadas
+        # (no se destruyen) y pueden volver a mostrarse sin recrearlas
+        self.bot_tree.set_children('', *[
+            self._item_ids[name] for name in names
+            if search_text in self._lower_names[name]
+        ])
             
     def filter_bots(self, *args):
         """Filtra la lista de bots según el texto de búsqueda"""
-        search_text = self.search_var.get().lower()
-        self.bot_tree.delete(*self.bot_tree.get_children())
-        
-        for name, bot in self.bots.items():
-            if search_text in name.lower():
-                dominant_trait = self.get_dominant_trait(bot.personality)
-                self.bot_tree.insert('', 'end', values=(name, dominant_trait))
+        # Agrupar pulsaciones rápidas en un único filtrado
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+        self._filter_job = self.after(self._FILTER_DELAY_MS, self._apply_filter)
+        
+    def _apply_filter(self):
+        """Muestra solo las filas cuyo nombre contiene el texto de búsqueda"""
+        self._filter_job = None
+        self._show_rows()
                 
     def update_status(self, message: str):
         """Actualiza el mensaje de la barra de estado"""
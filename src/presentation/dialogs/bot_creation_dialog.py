@@ -1,15 +1,21 @@
 import tkinter as tk
 from tkinter import ttk
+from functools import partial
+from bisect import bisect_left
 from typing import Callable, Optional
 from ...domain.entities.bot import Bot
 from ...domain.entities.personality import Personality
-from ...presentation.widgets.factor_slider import FactorSlider
+from ...domain.value_objects.personality_factor import PersonalityFactor
+from ...presentation.widgets.factor_row import FactorRow
+from ...presentation.widgets.factor_editing import FactorEditingMixin
+from ...presentation.screen import screen_size
 
-class BotCreationDialog(tk.Toplevel):
+class BotCreationDialog(FactorEditingMixin, tk.Toplevel):
     def __init__(self, parent, on_create: Callable[[Bot], None]):
         super().__init__(parent)
         self.on_create = on_create
         self.personality = Personality()
+        self._init_factor_editing()
         
         self.title("Crear Nuevo Bot")
         self.resizable(False, False)
@@ -27,8 +33,7 @@ class BotCreationDialog(tk.Toplevel):
         height = 700
         
         # Obtener dimensiones de la pantalla
-        screen_width = self.winfo_screenwidth()
-        screen_height = self.winfo_screenheight()
+        screen_width, screen_height = screen_size(self)
         
         # Calcular posición
         x = (screen_width - width) // 2
@@ -57,85 +62,42 @@ class BotCreationDialog(tk.Toplevel):
         personality_frame = ttk.LabelFrame(self, text="Personalidad", padding="10")
         personality_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
-        # Crear un canvas con scrollbar
-        canvas = tk.Canvas(personality_frame)
-        scrollbar = ttk.Scrollbar(personality_frame, orient="vertical", command=canvas.yview)
-        self.scrollable_frame = ttk.Frame(canvas)
-        
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Empaquetar los widgets
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # Los factores se reparten en dos pestañas: Tk solo dibuja los widgets
+        # de la pestaña visible y no hace falta un canvas con scroll
+        notebook = ttk.Notebook(personality_frame)
+        notebook.pack(fill=tk.BOTH, expand=True)
         
         # Crear controles para cada factor
         self.factor_controls = {}
-        factors_list = list(self.personality.FACTORS.items())
+        factors_list = Personality._FACTORS_ITEMS
         mid_point = len(factors_list) // 2
         
-        # Crear frames para dos columnas
-        left_frame = ttk.Frame(self.scrollable_frame)
-        right_frame = ttk.Frame(self.scrollable_frame)
-        left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5)
-        right_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5)
+        # Crear una página por cada mitad de los factores
+        first_page = ttk.Frame(notebook, padding=5)
+        second_page = ttk.Frame(notebook, padding=5)
+        notebook.add(first_page, text=f"Factores 1-{mid_point}")
+        notebook.add(second_page, text=f"Factores {mid_point + 1}-{len(factors_list)}")
         
-        # Distribuir factores en las columnas
+        # Distribuir factores en las páginas
         for i, (code, (name, low, high)) in enumerate(factors_list):
-            frame = left_frame if i < mid_point else right_frame
-            self.create_factor_control(frame, code, name, low, high)
-        
-        # Configurar el scroll con el mouse
-        self.scrollable_frame.bind('<Enter>', self._bound_to_mousewheel)
-        self.scrollable_frame.bind('<Leave>', self._unbound_to_mousewheel)
+            page = first_page if i < mid_point else second_page
+            self.create_factor_control(page, code, name, low, high)
         
     def create_factor_control(self, parent, code: str, name: str, low: str, high: str):
         """Crea un control completo para un factor de personalidad"""
-        frame = ttk.Frame(parent)
-        frame.pack(fill=tk.X, pady=2)
-        
-        # Label Frame para el factor
-        factor_frame = ttk.LabelFrame(frame, text=name)
-        factor_frame.pack(fill=tk.X, padx=5, pady=2)
-        
-        # Frame para los controles
-        controls_frame = ttk.Frame(factor_frame)
-        controls_frame.pack(fill=tk.X, padx=5, pady=5)
-        
-        # Slider personalizado
-        slider = FactorSlider(
-            controls_frame,
-            command=lambda value: self._on_slider_change(code, value)
+        # Slider, entry y descriptor en un solo widget, sin frames intermedios
+        row = FactorRow(
+            parent, name, low, high,
+            command=partial(self._schedule_show_value, code),
+            validatecommand=self._vcmd
         )
-        slider.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
-        # Entry para valor numérico
-        vcmd = (self.register(self._validate_numeric), '%P')
-        entry = ttk.Entry(controls_frame, width=6, validate='key', validatecommand=vcmd)
-        entry.insert(0, "0.00")
-        entry.pack(side=tk.LEFT, padx=5)
-        
-        # Label descriptor
-        description = ttk.Label(controls_frame, text="Neutral", width=15)
-        description.pack(side=tk.LEFT, padx=5)
-        
-        # Almacenar controles
-        self.factor_controls[code] = {
-            'slider': slider,
-            'entry': entry,
-            'description': description,
-            'low': low,
-            'high': high
-        }
+        row.pack(fill=tk.X, padx=5, pady=2)
+        self.factor_controls[code] = row
         
         # Configurar callbacks
-        entry.bind('<FocusOut>', lambda e, code=code: self._on_entry_change(code))
-        entry.bind('<Return>', lambda e, code=code: self._on_entry_change(code))
+        entry_changed = partial(self._entry_changed, code)
+        row.entry.bind('<FocusOut>', entry_changed)
+        row.entry.bind('<Return>', entry_changed)
         
     def create_button_section(self):
         """Crea la sección de botones de acción"""
@@ -160,75 +122,49 @@ class BotCreationDialog(tk.Toplevel):
             command=self.destroy
         ).pack(side=tk.RIGHT, padx=5)
         
-    def _validate_numeric(self, value: str) -> bool:
-        """Valida la entrada numérica"""
-        if value == "" or value == "-":
-            return True
-        try:
-            float_val = float(value)
-            return -1 <= float_val <= 1
-        except ValueError:
-            return False
-            
-    def _on_slider_change(self, code: str, value: float):
-        """Maneja el cambio en el slider"""
-        controls = self.factor_controls[code]
-        
+    def _show_value(self, code: str, value: float):
+        """Muestra en el entry y la descripción el valor del slider"""
         # Actualizar entry
-        controls['entry'].delete(0, tk.END)
-        controls['entry'].insert(0, f"{value:.2f}")
+        self.factor_controls[code].entry_var.set(f"{value:.2f}")
         
         # Actualizar descripción
         self._update_description(code, value)
             
     def _on_entry_change(self, code: str):
         """Maneja el cambio en el entry"""
-        controls = self.factor_controls[code]
+        row = self.factor_controls[code]
         try:
-            value = float(controls['entry'].get())
+            value = float(row.entry_var.get())
             value = max(-1, min(1, value))  # Clamp value
             
             # Actualizar slider
-            controls['slider'].set(value)
+            row.set(value)
             
             # Actualizar entry con el valor formateado
-            controls['entry'].delete(0, tk.END)
-            controls['entry'].insert(0, f"{value:.2f}")
+            row.entry_var.set(f"{value:.2f}")
             
             # Actualizar descripción
             self._update_description(code, value)
             
         except ValueError:
             # Restaurar valor anterior
-            controls['entry'].delete(0, tk.END)
-            controls['entry'].insert(0, "0.00")
+            row.entry_var.set("0.00")
             
     def _update_description(self, code: str, value: float):
         """Actualiza la descripción del factor basada en el valor"""
-        controls = self.factor_controls[code]
-        description = ""
-        
-        if value > 0.75:
-            description = f"Muy {controls['high']}"
-        elif value > 0.25:
-            description = controls['high']
-        elif value > -0.25:
-            description = "Neutral"
-        elif value > -0.75:
-            description = controls['low']
-        else:
-            description = f"Muy {controls['low']}"
-            
-        controls['description'].configure(text=description)
+        row = self.factor_controls[code]
+        # Mismos tramos que PersonalityFactor.get_descriptor; un valor igual a
+        # un límite cae en el tramo inferior
+        index = bisect_left(PersonalityFactor._DESCRIPTOR_BOUNDS, value)
+        row.set_description(row.descriptions[index])
         
     def _randomize(self):
         """Randomiza todos los valores de personalidad"""
         self.personality.randomize()
         for code, factor_value in self.personality.to_dict().items():
-            controls = self.factor_controls[code]
-            controls['slider'].set(factor_value)
-            controls['entry'].delete(0, tk.END)
-            controls['entry'].insert(0, f"{factor_value:.2f}")
+            row = self.factor_controls[code]
+            row.set(factor_value)
+            row.entry_var.set(f"{factor_value:.2f}")
             self._update_description(code, factor_value)
             
     def _create_bot(self):
@@ -238,11 +174,15 @@ class BotCreationDialog(tk.Toplevel):
             tk.messagebox.showerror("Error", "Por favor, introduce un nombre para el bot")
             return
             
+        # Reflejar en los entries los últimos movimientos de los sliders
+        self._cancel_flush()
+        self._flush_pending()
+        
         # Actualizar personalidad con valores actuales
         personality_values = {}
-        for code, controls in self.factor_controls.items():
+        for code, row in self.factor_controls.items():
             try:
-                value = float(controls['entry'].get())
+                value = float(row.entry_var.get())
                 personality_values[code] = max(-1, min(1, value))
             except ValueError:
                 personality_values[code] = 0.0
@@ -252,16 +192,3 @@ class BotCreationDialog(tk.Toplevel):
         
         self.on_create(bot)
         self.destroy()
-        
-    def _bound_to_mousewheel(self, event):
-        """Vincula el scroll del mouse"""
-        self.scrollable_frame.bind_all("<MouseWheel>", self._on_mousewheel)
-        
-    def _unbound_to_mousewheel(self, event):
-        """Desvincula el scroll del mouse"""
-        self.scrollable_frame.unbind_all("<MouseWheel>")
-        
-    def _on_mousewheel(self, event):
-        """Maneja el evento de scroll del mouse"""
-        canvas = event.widget.master.master
-        canvas.yview_scroll(int(-1*(event.delta/120)), "units")
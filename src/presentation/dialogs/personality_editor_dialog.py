@@ -1,13 +1,17 @@
 import tkinter as tk
 from tkinter import ttk
+from functools import partial
 from typing import Callable
 from ...domain.entities.personality import Personality
+from ...presentation.screen import screen_size
+from ...presentation.widgets.factor_editing import FactorEditingMixin
 
-class PersonalityEditorDialog(tk.Toplevel):
+class PersonalityEditorDialog(FactorEditingMixin, tk.Toplevel):
     def __init__(self, parent, personality: Personality, on_save: Callable):
         super().__init__(parent)
         self.personality = personality
         self.on_save = on_save
+        self._init_factor_editing()
         
         self.title("Editor de Personalidad")
         self._center_window()
@@ -15,11 +19,13 @@ class PersonalityEditorDialog(tk.Toplevel):
         
     def _center_window(self):
         """Centra la ventana en la pantalla"""
+        # Solo update_idletasks(): update() procesaría también eventos de usuario
         self.update_idletasks()
         width = 800
         height = 600
-        x = (self.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.winfo_screenheight() // 2) - (height // 2)
+        screen_width, screen_height = screen_size(self)
+        x = (screen_width // 2) - (width // 2)
+        y = (screen_height // 2) - (height // 2)
         self.geometry(f'{width}x{height}+{x}+{y}')
         
     def _create_widgets(self):
@@ -27,20 +33,19 @@ class PersonalityEditorDialog(tk.Toplevel):
         main_frame = ttk.Frame(self)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Frames para organizar los factores
-        left_frame = ttk.Frame(main_frame)
-        right_frame = ttk.Frame(main_frame)
-        left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        right_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # Dos columnas de igual ancho en una sola rejilla
+        main_frame.columnconfigure(0, weight=1, uniform='factors')
+        main_frame.columnconfigure(1, weight=1, uniform='factors')
         
         # Crear controles para cada factor
         self.factor_controls = {}
-        factors = list(self.personality.factors.items())
+        factors = self.personality.factors
         mid_point = len(factors) // 2
         
-        for i, (code, factor) in enumerate(factors):
-            frame = left_frame if i < mid_point else right_frame
-            self._create_factor_control(frame, factor)
+        # Primera mitad en la columna izquierda, el resto en la derecha
+        for i, factor in enumerate(factors.values()):
+            row, column = (i, 0) if i < mid_point else (i - mid_point, 1)
+            self._create_factor_control(main_frame, factor, row, column)
         
         # Botones de acción
         button_frame = ttk.Frame(self)
@@ -51,9 +56,9 @@ class PersonalityEditorDialog(tk.Toplevel):
         ttk.Button(button_frame, text="Guardar",
                   command=self._save).pack(side=tk.LEFT, padx=5)
     
-    def _create_factor_control(self, parent, factor):
+    def _create_factor_control(self, parent, factor, row: int, column: int):
         frame = ttk.LabelFrame(parent, text=factor.name)
-        frame.pack(fill=tk.X, padx=5, pady=5)
+        frame.grid(row=row, column=column, sticky='ew', padx=5, pady=5)
         
         # Slider
         slider = ttk.Scale(frame, from_=-1, to=1, orient=tk.HORIZONTAL,
@@ -61,82 +66,83 @@ class PersonalityEditorDialog(tk.Toplevel):
         slider.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
         
         # Entry numérico
-        vcmd = (self.register(self._validate_numeric), '%P')
-        entry = ttk.Entry(frame, width=6, validate='key', validatecommand=vcmd)
-        entry.insert(0, f"{factor.value:.2f}")
+        var = tk.StringVar(value=f"{factor.value:.2f}")
+        entry = ttk.Entry(frame, width=6, textvariable=var,
+                          validate='key', validatecommand=self._vcmd)
         entry.pack(side=tk.LEFT, padx=5)
         
         # Label descriptor
-        descriptor = ttk.Label(frame, text=factor.get_descriptor(), width=15)
+        descriptor_text = factor.get_descriptor()
+        descriptor = ttk.Label(frame, text=descriptor_text, width=15)
         descriptor.pack(side=tk.LEFT, padx=5)
         
         # Almacenar controles y configurar callbacks
         self.factor_controls[factor.code] = {
             'slider': slider,
             'entry': entry,
+            'var': var,
             'descriptor': descriptor,
+            'last_desc': descriptor_text,
             'factor': factor
         }
         
         # Configurar callbacks
-        slider.configure(command=lambda value, code=factor.code: 
-                       self._on_slider_change(code, float(value)))
-        entry.bind('<FocusOut>', lambda e, code=factor.code: 
-                  self._on_entry_change(code))
-        entry.bind('<Return>', lambda e, code=factor.code: 
-                  self._on_entry_change(code))
+        slider.configure(command=partial(self._on_slider_change, factor.code))
+        entry_changed = partial(self._entry_changed, factor.code)
+        entry.bind('<FocusOut>', entry_changed)
+        entry.bind('<Return>', entry_changed)
     
-    def _validate_numeric(self, value):
-        if value == "" or value == "-":
-            return True
-        try:
-            float_val = float(value)
-            return -1 <= float_val <= 1
-        except ValueError:
-            return False
+    def _on_slider_change(self, code: str, value):
+        # ttk.Scale pasa el valor como cadena
+        value = float(value)
+        self.factor_controls[code]['factor'].value = value
+        self._schedule_show_value(code, value)
     
-    def _on_slider_change(self, code: str, value: float):
+    def _show_value(self, code: str, value: float):
+        """Muestra en el entry y el descriptor el valor del slider"""
         controls = self.factor_controls[code]
-        factor = controls['factor']
-        factor.value = value
-        
-        controls['entry'].delete(0, tk.END)
-        controls['entry'].insert(0, f"{value:.2f}")
-        controls['descriptor'].config(text=factor.get_descriptor())
+        controls['var'].set(f"{value:.2f}")
+        self._update_descriptor(controls)
+    
+    def _update_descriptor(self, controls: dict):
+        """Muestra el descriptor del factor, sin llamar a Tk si no ha cambiado"""
+        text = controls['factor'].get_descriptor()
+        if text != controls['last_desc']:
+            controls['last_desc'] = text
+            controls['descriptor'].config(text=text)
     
     def _on_entry_change(self, code: str):
         controls = self.factor_controls[code]
         try:
-            value = float(controls['entry'].get())
+            value = float(controls['var'].get())
             value = max(-1, min(1, value))  # Clamp value
             
             controls['slider'].set(value)
             controls['factor'].value = value
-            controls['descriptor'].config(text=controls['factor'].get_descriptor())
+            self._update_descriptor(controls)
             
-            controls['entry'].delete(0, tk.END)
-            controls['entry'].insert(0, f"{value:.2f}")
+            controls['var'].set(f"{value:.2f}")
         except ValueError:
             # Restaurar valor anterior
-            controls['entry'].delete(0, tk.END)
-            controls['entry'].insert(0, f"{controls['factor'].value:.2f}")
+            controls['var'].set(f"{controls['factor'].value:.2f}")
     
     def _randomize(self):
         self.personality.randomize()
         for code, controls in self.factor_controls.items():
             value = self.personality.factors[code].value
             controls['slider'].set(value)
-            controls['entry'].delete(0, tk.END)
-            controls['entry'].insert(0, f"{value:.2f}")
-            controls['descriptor'].config(
-                text=self.personality.factors[code].get_descriptor()
-            )
+            controls['var'].set(f"{value:.2f}")
+            self._update_descriptor(controls)
     
     def _save(self):
+        # Reflejar en los entries los últimos movimientos de los sliders
+        self._cancel_flush()
+        self._flush_pending()
+        
         # Actualizar todos los valores antes de guardar
         for code, controls in self.factor_controls.items():
             try:
-                value = float(controls['entry'].get())
+                value = float(controls['var'].get())
                 self.personality.factors[code].value = max(-1, min(1, value))
             except ValueError:
                 continue
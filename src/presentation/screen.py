@@ -0,0 +1,17 @@
+from typing import Dict, Tuple
+
+# Dimensiones de la pantalla por intérprete de Tcl; no cambian durante la ejecución
+_SCREEN_CACHE: Dict[int, Tuple[int, int]] = {}
+
+def screen_size(widget) -> Tuple[int, int]:
+    """
+    Obtiene el ancho y alto de la pantalla en la que se muestra el widget.
+    
+    Solo se consulta a Tk la primera vez; las ventanas siguientes reutilizan
+    el resultado.
+    """
+    key = id(widget.tk)
+    size = _SCREEN_CACHE.get(key)
+    if size is None:
+        size = _SCREEN_CACHE[key] = (widget.winfo_screenwidth(), widget.winfo_screenheight())
+    return size
@@ -0,0 +1,68 @@
+# src/presentation/widgets/factor_editing.py
+
+import re
+
+# Entrada numérica válida, también a medio escribir ("", "-", ".", "-0.")
+_NUMERIC_RE = re.compile(r'-?(?:\d+\.?\d*|\.\d*)?')
+
+def validate_factor_entry(value: str) -> bool:
+    """Valida el texto de un entry de factor: un número en [-1, 1], quizá a medio escribir"""
+    # Signo y punto decimal opcionales; se aceptan valores a medio escribir
+    if not _NUMERIC_RE.fullmatch(value):
+        return False
+    # Superada la expresión, float() no falla si hay algún dígito
+    return value.strip('-.') == '' or -1 <= float(value) <= 1
+
+class FactorEditingMixin:
+    """
+    Comportamiento común de los diálogos que editan factores con slider y entry.
+
+    Se combina con tk.Toplevel (antes que él en las bases) y aporta el comando
+    de validación de los entries y la actualización diferida de la vista: los
+    movimientos de los sliders se acumulan y se muestran una vez por ciclo
+    ocioso. Cada diálogo implementa _show_value y _on_entry_change.
+    """
+
+    def _init_factor_editing(self):
+        """Prepara el estado compartido; se llama tras inicializar el Toplevel"""
+        # Últimos valores de los sliders movidos, pendientes de mostrar
+        self._pending = {}
+        self._flush_id = None
+        # Un único comando Tcl de validación compartido por todos los entries
+        self._vcmd = (self.register(validate_factor_entry), '%P')
+
+    def _show_value(self, code: str, value: float):
+        """Muestra en el entry y el descriptor del factor el valor indicado"""
+        raise NotImplementedError
+
+    def _on_entry_change(self, code: str):
+        """Aplica el valor escrito en el entry del factor"""
+        raise NotImplementedError
+
+    def _schedule_show_value(self, code: str, value: float):
+        """Anota el valor de un slider; la vista se actualiza una vez por ciclo ocioso"""
+        self._pending[code] = value
+        if self._flush_id is None:
+            self._flush_id = self.after_idle(self._flush_pending)
+
+    def _flush_pending(self):
+        """Muestra el último valor de cada slider movido"""
+        self._flush_id = None
+        pending, self._pending = self._pending, {}
+        for code, value in pending.items():
+            self._show_value(code, value)
+
+    def _cancel_flush(self):
+        """Cancela la actualización pendiente de la vista, si la hay"""
+        if self._flush_id is not None:
+            self.after_cancel(self._flush_id)
+            self._flush_id = None
+
+    def _entry_changed(self, code: str, event):
+        """Adapta los eventos del entry a _on_entry_change"""
+        self._on_entry_change(code)
+
+    def destroy(self):
+        """Cierra el diálogo sin dejar actualizaciones pendientes"""
+        self._cancel_flush()
+        super().destroy()
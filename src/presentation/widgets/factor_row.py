@@ -0,0 +1,65 @@
+# src/presentation/widgets/factor_row.py
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Callable, Optional
+
+class FactorRow(ttk.LabelFrame):
+    """
+    Control completo de un factor de personalidad: slider, valor numérico y
+    descriptor dentro de un único LabelFrame, sin frames intermedios.
+    """
+
+    def __init__(self,
+                 master,
+                 name: str,
+                 low: str,
+                 high: str,
+                 command: Optional[Callable[[float], None]] = None,
+                 validatecommand=None,
+                 **kwargs):
+        super().__init__(master, text=name, **kwargs)
+        # Descriptores de cada tramo de valores, de menor a mayor
+        self.descriptions = (f"Muy {low}", low, "Neutral", high, f"Muy {high}")
+        self._description_text = "Neutral"
+        self.command = command
+        self.value = tk.DoubleVar(value=0.0)
+        # Texto del entry; se reemplaza con una sola llamada a set()
+        self.entry_var = tk.StringVar(value="0.00")
+        self.setup_ui(validatecommand)
+
+    def setup_ui(self, validatecommand):
+        self.slider = ttk.Scale(
+            self,
+            from_=-1.0,
+            to=1.0,
+            orient=tk.HORIZONTAL,
+            variable=self.value
+        )
+        self.slider.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 0), pady=5)
+
+        self.entry = ttk.Entry(self, width=6, textvariable=self.entry_var,
+                               validate='key', validatecommand=validatecommand)
+        self.entry.pack(side=tk.LEFT, padx=5, pady=5)
+
+        self.description = ttk.Label(self, text=self._description_text, width=15)
+        self.description.pack(side=tk.LEFT, padx=5, pady=5)
+
+        if self.command:
+            self.value.trace_add('write', self._on_value_change)
+
+    def _on_value_change(self, *args):
+        if self.command:
+            self.command(self.value.get())
+
+    def get(self) -> float:
+        return self.value.get()
+
+    def set(self, value: float):
+        self.value.set(value)
+
+    def set_description(self, text: str):
+        # Sin llamada a Tk mientras el valor no cambie de tramo
+        if text != self._description_text:
+            self._description_text = text
+            self.description.configure(text=text)